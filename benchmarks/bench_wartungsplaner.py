@@ -0,0 +1,299 @@
+"""Benchmarks for the Wartungsplaner store, coordinator and platform hot paths.
+
+Runs against a real (not started) Home Assistant core instance in a temporary
+config directory, so a Home Assistant development environment is required:
+
+    python benchmarks/bench_wartungsplaner.py --sizes 100 1000 --output report.json
+    python benchmarks/bench_wartungsplaner.py --compare report.json
+
+Synthetic stores are generated with a fixed seed relative to a fixed reference
+date, and the clock is pinned to that date while benchmarking, so every run
+works on the same data.
+Results are written as JSON and can be compared between versions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from custom_components.wartungsplaner.calendar import WartungsplanerCalendar
+from custom_components.wartungsplaner.const import (
+    HISTORY_STORAGE_KEY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    VERSION,
+    IntervalUnit,
+    TaskCategory,
+    TaskPriority,
+)
+from custom_components.wartungsplaner.coordinator import WartungsplanerCoordinator
+from custom_components.wartungsplaner.models import format_date
+from custom_components.wartungsplaner.sensor import WartungsplanerTaskSensor
+from custom_components.wartungsplaner.store import (
+    WartungsplanerStore,
+    _calculate_next_due,
+)
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+SEED = 20240101
+# Generated dates and the clock seen by the integration are relative to this
+REFERENCE_TIME = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+def generate_data(size: int, seed: int = SEED) -> tuple[dict, dict]:
+    """Return (task storage data, history storage data) for a synthetic store."""
+    rng = random.Random(seed + size)
+    today = REFERENCE_TIME.date()
+    now = REFERENCE_TIME.isoformat()
+    categories = list(TaskCategory)
+    priorities = list(TaskPriority)
+    units = list(IntervalUnit)
+
+    tasks: dict[str, dict[str, Any]] = {}
+    history: dict[str, dict[str, Any]] = {}
+    for index in range(size):
+        task_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        unit = rng.choice(units)
+        interval = rng.randint(1, 12)
+        completions = rng.choice((0, 1, 3, 10, 50, 200))
+        last_completed = None
+        if completions:
+            last_completed = today - timedelta(days=rng.randint(0, 400))
+        snoozed_until = None
+        if rng.random() < 0.05:
+            snoozed_until = today + timedelta(days=rng.randint(1, 30))
+        next_due = _calculate_next_due(last_completed, interval, unit, snoozed_until)
+        tasks[task_id] = {
+            "id": task_id,
+            "name": f"Aufgabe {index}",
+            "description": "Synthetische Wartungsaufgabe für Benchmarks " * 2,
+            "manufacturer": rng.choice(("", "Bosch", "Viessmann", "Vaillant")),
+            "category": rng.choice(categories).value,
+            "priority": rng.choice(priorities).value,
+            "interval_value": interval,
+            "interval_unit": unit.value,
+            "last_completed": format_date(last_completed),
+            "completion_count": completions,
+            "next_due": format_date(next_due),
+            "snoozed_until": format_date(snoozed_until),
+            "created_at": now,
+            "updated_at": now,
+        }
+        if completions:
+            detailed = min(completions, 50)
+            history[task_id] = {
+                "entries": [
+                    {
+                        "date": (today - timedelta(days=7 * n)).isoformat(),
+                        "notes": "",
+                        "timestamp": now,
+                    }
+                    for n in range(detailed, 0, -1)
+                ],
+                "summaries": (
+                    {
+                        str(today.year - 5): {
+                            "count": completions - detailed,
+                            "first": f"{today.year - 5}-01-01",
+                            "last": f"{today.year - 5}-12-31",
+                        }
+                    }
+                    if completions > detailed
+                    else {}
+                ),
+            }
+
+    return (
+        {
+            "tasks": tasks,
+            "custom_templates": {},
+            "custom_categories": {},
+            "hidden_templates": [],
+            "settings": {"due_soon_days": 7},
+        },
+        {"tasks": history},
+    )
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any] | Any], repeat: int
+) -> dict[str, float]:
+    """Run a benchmark function and return timing statistics in ms."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        if asyncio.iscoroutine(result):
+            await result
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "mean_ms": statistics.fmean(timings),
+        "repeat": repeat,
+    }
+
+
+async def run_size(hass: HomeAssistant, size: int, repeat: int) -> list[dict]:
+    """Run all benchmarks for one store size."""
+    data, history = generate_data(size)
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY).async_save(data)
+    await Store(hass, STORAGE_VERSION, HISTORY_STORAGE_KEY).async_save(history)
+
+    results: list[dict] = []
+    rng = random.Random(SEED + size)
+
+    def record(name: str, stats: dict[str, float]) -> None:
+        results.append({"size": size, "benchmark": name, **stats})
+        print(f"{size:>7} {name:<32} {stats['median_ms']:>10.2f} ms")
+
+    async def load() -> None:
+        await WartungsplanerStore(hass).async_load()
+
+    record("store.async_load", await measure(load, repeat))
+
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    record("store.async_save", await measure(store.async_save, repeat))
+
+    async def full_update() -> None:
+        coordinator = WartungsplanerCoordinator(hass, store)
+        await coordinator._async_update_data()
+        coordinator._async_cancel_transition()
+
+    record("coordinator.full_update", await measure(full_update, repeat))
+
+    coordinator = WartungsplanerCoordinator(hass, store)
+    await coordinator.async_refresh()
+    task_ids = list(store.tasks)
+
+    async def single_task_update() -> None:
+        await store.async_complete_task(rng.choice(task_ids))
+        await coordinator._async_update_data()
+
+    record(
+        "coordinator.single_task_update", await measure(single_task_update, repeat)
+    )
+    # Leave the coordinator data consistent with the store for the platforms
+    await coordinator.async_refresh()
+
+    calendar = WartungsplanerCalendar(coordinator)
+    window_start = dt_util.start_of_local_day()
+    window_end = window_start + timedelta(days=365)
+
+    async def calendar_year() -> None:
+        await calendar.async_get_events(hass, window_start, window_end)
+
+    record("calendar.async_get_events_year", await measure(calendar_year, repeat))
+    record("calendar.event", await measure(lambda: calendar.event, repeat))
+
+    sensors = [WartungsplanerTaskSensor(coordinator, task_id) for task_id in task_ids]
+
+    def sensor_attributes() -> None:
+        for sensor in sensors:
+            sensor.extra_state_attributes  # noqa: B018
+
+    record("sensor.extra_state_attributes", await measure(sensor_attributes, repeat))
+
+    await store.async_flush()
+    await coordinator.async_shutdown()
+    return results
+
+
+def _reference_now(time_zone: tzinfo | None = None) -> datetime:
+    """Return the pinned current time, replacing dt_util.now."""
+    return REFERENCE_TIME.astimezone(time_zone or dt_util.get_default_time_zone())
+
+
+async def run(sizes: list[int], repeat: int) -> dict[str, Any]:
+    """Run the benchmarks for all sizes in a temporary config directory."""
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch.object(dt_util, "now", _reference_now),
+    ):
+        hass = HomeAssistant(config_dir)
+        if hasattr(frame, "async_setup"):
+            frame.async_setup(hass)
+        results: list[dict] = []
+        try:
+            for size in sizes:
+                results.extend(await run_size(hass, size, repeat))
+        finally:
+            await hass.async_stop(force=True)
+
+    return {
+        "integration_version": VERSION,
+        "reference_time": REFERENCE_TIME.isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(),
+        "results": results,
+    }
+
+
+def compare(previous: dict[str, Any], current: dict[str, Any]) -> None:
+    """Print median ratios of the current run against a previous report."""
+    old = {(r["size"], r["benchmark"]): r for r in previous["results"]}
+    print(
+        f"\nCompared with {previous['integration_version']} "
+        f"({previous['timestamp']}):"
+    )
+    for result in current["results"]:
+        before = old.get((result["size"], result["benchmark"]))
+        if before is None or not before["median_ms"]:
+            continue
+        ratio = result["median_ms"] / before["median_ms"]
+        print(
+            f"{result['size']:>7} {result['benchmark']:<32} "
+            f"{before['median_ms']:>10.2f} -> {result['median_ms']:>10.2f} ms "
+            f"(x{ratio:.2f})"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output", type=Path, help="write the JSON report to this file"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="compare against a previous JSON report"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.sizes, args.repeat))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nReport written to {args.output}")
+    if args.compare:
+        compare(json.loads(args.compare.read_text(encoding="utf-8")), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.components.frontend import async_register_built_in_panel
 from homeassistant.components.http import StaticPathConfig
@@ -21,6 +28,13 @@ from .const import (
 )
 from .coordinator import WartungsplanerCoordinator
 from .store import WartungsplanerStore
+from .transfer import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    ImportParser,
+    iter_chunks,
+    iter_export,
+)
 from .websocket_api import async_register_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +44,18 @@ SERVICE_ADD_TASK = "add_task"
 SERVICE_UPDATE_TASK = "update_task"
 SERVICE_DELETE_TASK = "delete_task"
 SERVICE_SNOOZE_TASK = "snooze_task"
+SERVICE_BULK_ADD_TASKS = "bulk_add_tasks"
+SERVICE_BULK_UPDATE_TASKS = "bulk_update_tasks"
+SERVICE_BULK_COMPLETE_TASKS = "bulk_complete_tasks"
+SERVICE_BULK_SNOOZE_TASKS = "bulk_snooze_tasks"
+SERVICE_BULK_DELETE_TASKS = "bulk_delete_tasks"
+SERVICE_EXPORT_TASKS = "export_tasks"
+SERVICE_IMPORT_TASKS = "import_tasks"
+
+# Export files live in this folder of the config directory
+TRANSFER_DIR = DOMAIN
+# Characters read per chunk when importing a file
+IMPORT_READ_SIZE = 64 * 1024
 
 SERVICE_COMPLETE_SCHEMA = vol.Schema(
     {
@@ -62,6 +88,7 @@ SERVICE_UPDATE_SCHEMA = vol.Schema(
             vol.Coerce(int), vol.Range(min=1)
         ),
         vol.Optional("interval_unit"): cv.string,
+        vol.Optional("last_completed"): cv.date,
     }
 )
 
@@ -78,6 +105,54 @@ SERVICE_SNOOZE_SCHEMA = vol.Schema(
     }
 )
 
+SERVICE_BULK_ADD_SCHEMA = vol.Schema(
+    {
+        vol.Required("tasks"): [SERVICE_ADD_SCHEMA],
+    }
+)
+
+SERVICE_BULK_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Required("tasks"): [SERVICE_UPDATE_SCHEMA],
+    }
+)
+
+SERVICE_BULK_COMPLETE_SCHEMA = vol.Schema(
+    {
+        vol.Required("task_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("notes", default=""): cv.string,
+    }
+)
+
+SERVICE_BULK_SNOOZE_SCHEMA = vol.Schema(
+    {
+        vol.Required("task_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required("until_date"): cv.string,
+    }
+)
+
+SERVICE_BULK_DELETE_SCHEMA = vol.Schema(
+    {
+        vol.Required("task_ids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+def _file_name(value: Any) -> str:
+    """Validate a plain file name without directories."""
+    name = cv.string(value)
+    if not name or os.path.basename(name) != name or name in (".", ".."):
+        raise vol.Invalid("expected a file name without directories")
+    return name
+
+
+SERVICE_TRANSFER_SCHEMA = vol.Schema(
+    {
+        vol.Required("filename"): _file_name,
+        vol.Optional("format", default="ndjson"): vol.In(EXPORT_FORMATS),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Wartungsplaner from a config entry."""
@@ -116,6 +191,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        # Write out any mutations still waiting in the delayed save window
+        await hass.data[DOMAIN]["store"].async_flush()
+        await hass.data[DOMAIN]["coordinator"].async_shutdown()
         hass.data.pop(DOMAIN, None)
 
     return unload_ok
@@ -243,6 +321,133 @@ async def _async_register_services(
         if result:
             await coordinator.async_refresh()
 
+    async def _async_run_bulk(
+        call: ServiceCall, operations: list[dict[str, Any]]
+    ) -> ServiceResponse:
+        """Apply bulk operations with one save and one refresh."""
+        applied, results = await store.async_bulk(operations)
+        if applied:
+            await coordinator.async_refresh()
+        else:
+            _LOGGER.warning(
+                "%s rejected, %d of %d operations are invalid",
+                call.service,
+                sum(1 for result in results if not result["success"]),
+                len(results),
+            )
+        if not call.return_response:
+            return None
+        return {"applied": applied, "results": results}
+
+    async def handle_bulk_add_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the bulk_add_tasks service call."""
+        return await _async_run_bulk(
+            call, [{"op": "add", **task} for task in call.data["tasks"]]
+        )
+
+    async def handle_bulk_update_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the bulk_update_tasks service call."""
+        return await _async_run_bulk(
+            call, [{"op": "update", **task} for task in call.data["tasks"]]
+        )
+
+    async def handle_bulk_complete_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the bulk_complete_tasks service call."""
+        return await _async_run_bulk(
+            call,
+            [
+                {"op": "complete", "task_id": task_id, "notes": call.data["notes"]}
+                for task_id in call.data["task_ids"]
+            ],
+        )
+
+    async def handle_bulk_snooze_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the bulk_snooze_tasks service call."""
+        return await _async_run_bulk(
+            call,
+            [
+                {
+                    "op": "snooze",
+                    "task_id": task_id,
+                    "until_date": call.data["until_date"],
+                }
+                for task_id in call.data["task_ids"]
+            ],
+        )
+
+    async def handle_bulk_delete_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the bulk_delete_tasks service call."""
+        return await _async_run_bulk(
+            call,
+            [{"op": "delete", "task_id": task_id} for task_id in call.data["task_ids"]],
+        )
+
+    async def handle_export_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the export_tasks service call.
+
+        Records are built and written chunk by chunk, so the export never
+        exists in memory as a whole.
+        """
+        directory = hass.config.path(TRANSFER_DIR)
+        path = os.path.join(directory, call.data["filename"])
+
+        def _open() -> Any:
+            os.makedirs(directory, exist_ok=True)
+            return open(path, "w", encoding="utf-8", newline="")
+
+        records = 0
+        file = await hass.async_add_executor_job(_open)
+        try:
+            for chunk, count in iter_chunks(
+                iter_export(store, call.data["format"]), DEFAULT_CHUNK_SIZE
+            ):
+                await hass.async_add_executor_job(file.write, chunk)
+                records += count
+        finally:
+            await hass.async_add_executor_job(file.close)
+        _LOGGER.info("Exported %d records to %s", records, path)
+        if not call.return_response:
+            return None
+        return {"path": path, "records": records}
+
+    async def handle_import_tasks(call: ServiceCall) -> ServiceResponse:
+        """Handle the import_tasks service call."""
+        path = os.path.join(hass.config.path(TRANSFER_DIR), call.data["filename"])
+        parser = ImportParser(call.data["format"])
+        try:
+            file = await hass.async_add_executor_job(
+                lambda: open(path, encoding="utf-8", newline="")
+            )
+        except OSError as err:
+            raise HomeAssistantError(f"Cannot open {path}: {err}") from err
+        try:
+            while chunk := await hass.async_add_executor_job(
+                file.read, IMPORT_READ_SIZE
+            ):
+                parser.feed(chunk)
+        finally:
+            await hass.async_add_executor_job(file.close)
+        parser.close()
+
+        if parser.errors:
+            _LOGGER.warning(
+                "Import of %s rejected, first error in line %d: %s",
+                path,
+                parser.errors[0]["line"],
+                parser.errors[0]["error"],
+            )
+            if not call.return_response:
+                return None
+            return {"applied": False, "errors": parser.errors}
+
+        counts = await store.async_import(
+            parser.tasks, parser.history, parser.templates, parser.categories
+        )
+        await coordinator.async_refresh()
+        if not call.return_response:
+            return None
+        return {"applied": True, **counts}
+
     hass.services.async_register(
         DOMAIN, SERVICE_COMPLETE_TASK, handle_complete_task, SERVICE_COMPLETE_SCHEMA
     )
@@ -258,3 +463,36 @@ async def _async_register_services(
     hass.services.async_register(
         DOMAIN, SERVICE_SNOOZE_TASK, handle_snooze_task, SERVICE_SNOOZE_SCHEMA
     )
+
+    for service, handler, schema in (
+        (SERVICE_BULK_ADD_TASKS, handle_bulk_add_tasks, SERVICE_BULK_ADD_SCHEMA),
+        (
+            SERVICE_BULK_UPDATE_TASKS,
+            handle_bulk_update_tasks,
+            SERVICE_BULK_UPDATE_SCHEMA,
+        ),
+        (
+            SERVICE_BULK_COMPLETE_TASKS,
+            handle_bulk_complete_tasks,
+            SERVICE_BULK_COMPLETE_SCHEMA,
+        ),
+        (
+            SERVICE_BULK_SNOOZE_TASKS,
+            handle_bulk_snooze_tasks,
+            SERVICE_BULK_SNOOZE_SCHEMA,
+        ),
+        (
+            SERVICE_BULK_DELETE_TASKS,
+            handle_bulk_delete_tasks,
+            SERVICE_BULK_DELETE_SCHEMA,
+        ),
+        (SERVICE_EXPORT_TASKS, handle_export_tasks, SERVICE_TRANSFER_SCHEMA),
+        (SERVICE_IMPORT_TASKS, handle_import_tasks, SERVICE_TRANSFER_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
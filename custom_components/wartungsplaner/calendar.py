@@ -3,20 +3,53 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import CATEGORY_LABELS, DOMAIN, PRIORITY_LABELS
 from .coordinator import WartungsplanerCoordinator
+from .models import TaskState
+from .recurrence import task_occurrences
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of date ranges whose occurrence expansions are kept
+MAX_CACHED_WINDOWS = 8
+# Above this many changed tasks a window is re-sorted instead of patched
+MAX_WINDOW_PATCHES = 64
+
+
+@dataclass(slots=True)
+class _TaskEvents:
+    """Calendar events built for one revision of a task."""
+
+    revision: str
+    summary: str
+    description: str
+    events: dict[date, CalendarEvent] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _Window:
+    """Occurrences of all tasks within one requested date range."""
+
+    # Task ID -> (revision, occurrence dates)
+    occurrences: dict[str, tuple[str, tuple[date, ...]]]
+    # Sorted (date, task ID) pairs of all occurrences
+    entries: list[tuple[date, str]]
+    # Occurrences of overdue tasks are projected from this day
+    today: date
+    # Tasks added, changed or removed since the window was last used
+    pending: set[str] = field(default_factory=set)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -41,24 +74,38 @@ class WartungsplanerCalendar(
     def __init__(self, coordinator: WartungsplanerCoordinator) -> None:
         """Initialize the calendar entity."""
         super().__init__(coordinator)
+        self._windows: dict[tuple[date, date], _Window] = {}
+        self._task_events: dict[str, _TaskEvents] = {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Mark tasks touched by the coordinator update in all windows."""
+        changes = self.coordinator.last_changes
+        touched = changes.added | changes.changed | changes.removed
+        for task_id in changes.removed:
+            self._task_events.pop(task_id, None)
+        if touched:
+            for window in self._windows.values():
+                window.pending |= touched
+        super()._handle_coordinator_update()
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming calendar event."""
-        events = self._get_all_events()
-        if not events:
+        if self.coordinator.data is None:
             return None
 
-        today = date.today()
+        today = dt_util.now().date()
         # Find the closest event to today (could be past for overdue)
-        upcoming = [e for e in events if e.start >= today]
-        if upcoming:
-            upcoming.sort(key=lambda e: e.start)
-            return upcoming[0]
+        state = self.coordinator.get_next_due_task(today)
+        if state is None:
+            # All events are in the past (overdue), return the most recent
+            task_id = self.coordinator.due_index.last()
+            if task_id is None:
+                return None
+            state = self.coordinator.data["tasks"][task_id]
 
-        # All events are in the past (overdue), return the most recent
-        events.sort(key=lambda e: e.start, reverse=True)
-        return events[0]
+        return self._get_event(state, state.task.next_due)
 
     async def async_get_events(
         self,
@@ -67,55 +114,151 @@ class WartungsplanerCalendar(
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a date range."""
-        events = self._get_all_events()
+        if self.coordinator.data is None:
+            return []
+
         start = start_date.date() if isinstance(start_date, datetime) else start_date
         end = end_date.date() if isinstance(end_date, datetime) else end_date
 
+        window = self._get_window(start, end)
+        tasks = self.coordinator.data["tasks"]
         return [
-            e
-            for e in events
-            if e.start < end and e.end > start
+            self._get_event(tasks[task_id], day) for day, task_id in window.entries
         ]
 
-    def _get_all_events(self) -> list[CalendarEvent]:
-        """Get all calendar events from tasks."""
-        if self.coordinator.data is None:
-            return []
+    def _get_window(self, start: date, end: date) -> _Window:
+        """Return the occurrences in [start, end), reusing earlier results."""
+        key = (start, end)
+        today = dt_util.now().date()
+        window = self._windows.pop(key, None)
+        if window is None or window.today != today:
+            window = self._build_window(start, end, today)
+            if len(self._windows) >= MAX_CACHED_WINDOWS:
+                self._evict_window(key)
+        elif window.pending:
+            self._patch_window(window, start, end, today)
+        self._windows[key] = window
+        return window
 
-        tasks = self.coordinator.data.get("tasks", {})
-        events: list[CalendarEvent] = []
+    def _evict_window(self, new_key: tuple[date, date]) -> None:
+        """Drop the least recently used window and events outside the rest."""
+        del self._windows[next(iter(self._windows))]
+        ranges = [*self._windows, new_key]
+        for task_id, task_events in list(self._task_events.items()):
+            for day in [
+                day
+                for day in task_events.events
+                if not any(start <= day < end for start, end in ranges)
+            ]:
+                del task_events.events[day]
+            if not task_events.events:
+                del self._task_events[task_id]
 
-        for task_id, task in tasks.items():
-            next_due_str = task.get("next_due")
-            if next_due_str is None:
-                continue
+    def _build_window(self, start: date, end: date, today: date) -> _Window:
+        """Expand the occurrences of all tasks due before the end of a range.
 
-            try:
-                due_date = date.fromisoformat(next_due_str)
-            except (ValueError, TypeError):
+        All-day events span [due, due + 1), so they overlap the range exactly
+        when start <= due < end. Tasks recur from their next due date, or from
+        today if overdue, so every task due before the end can have
+        occurrences in the range.
+        """
+        occurrences: dict[str, tuple[str, tuple[date, ...]]] = {}
+        entries: list[tuple[date, str]] = []
+        for state in self.coordinator.get_tasks_due_between(None, end):
+            days = self._expand(state, start, end, today)
+            occurrences[state.task.id] = (state.task.updated_at, days)
+            entries.extend((day, state.task.id) for day in days)
+        entries.sort()
+        return _Window(occurrences, entries, today)
+
+    def _patch_window(
+        self, window: _Window, start: date, end: date, today: date
+    ) -> None:
+        """Re-expand pending tasks whose revision changed."""
+        tasks = self.coordinator.data["tasks"]
+        removed: list[tuple[date, str]] = []
+        added: list[tuple[date, str]] = []
+        for task_id in window.pending:
+            state = tasks.get(task_id)
+            old = window.occurrences.get(task_id)
+            if (
+                state is not None
+                and old is not None
+                and old[0] == state.task.updated_at
+            ):
+                continue
+            if old is not None:
+                del window.occurrences[task_id]
+                removed.extend((day, task_id) for day in old[1])
+            if state is None or state.task.next_due is None:
                 continue
+            days = self._expand(state, start, end, today)
+            window.occurrences[task_id] = (state.task.updated_at, days)
+            added.extend((day, task_id) for day in days)
+        window.pending.clear()
 
-            category = task.get("category", "other")
-            priority = task.get("priority", "medium")
-            cat_label = CATEGORY_LABELS.get(category, {}).get("de", category)
-            prio_label = PRIORITY_LABELS.get(priority, {}).get("de", priority)
-
-            description = task.get("description", "")
-            summary_parts = [f"[{cat_label}]", task["name"]]
-            desc_parts = [
-                f"Priorität: {prio_label}",
-                f"Kategorie: {cat_label}",
-            ]
-            if description:
-                desc_parts.append(f"\n{description}")
-
-            event = CalendarEvent(
+        if len(removed) + len(added) > MAX_WINDOW_PATCHES:
+            window.entries = sorted(
+                (day, task_id)
+                for task_id, (_, days) in window.occurrences.items()
+                for day in days
+            )
+            return
+        for entry in removed:
+            del window.entries[bisect_left(window.entries, entry)]
+        for entry in added:
+            insort(window.entries, entry)
+
+    @staticmethod
+    def _expand(
+        state: TaskState, start: date, end: date, today: date
+    ) -> tuple[date, ...]:
+        """Return the occurrences of a task in [start, end)."""
+        task = state.task
+        return task_occurrences(
+            task.next_due, task.interval_value, task.interval_unit, today, start, end
+        )
+
+    def _get_event(self, state: TaskState, due_date: date) -> CalendarEvent:
+        """Return the cached event of a task occurrence, building it if needed."""
+        task = state.task
+        task_events = self._task_events.get(task.id)
+        if task_events is None or task_events.revision != task.updated_at:
+            task_events = self._task_events[task.id] = self._build_texts(state)
+        event = task_events.events.get(due_date)
+        if event is None:
+            uid = f"wartungsplaner_{task.id}"
+            if due_date != task.next_due:
+                uid = f"{uid}_{due_date.isoformat()}"
+            event = task_events.events[due_date] = CalendarEvent(
                 start=due_date,
                 end=due_date + timedelta(days=1),
-                summary=" ".join(summary_parts),
-                description="\n".join(desc_parts),
-                uid=f"wartungsplaner_{task_id}",
+                summary=task_events.summary,
+                description=task_events.description,
+                uid=uid,
             )
-            events.append(event)
+        return event
+
+    @staticmethod
+    def _build_texts(state: TaskState) -> _TaskEvents:
+        """Build the summary and description shared by a task's events."""
+        task = state.task
+        category = task.category
+        priority = task.priority
+        cat_label = CATEGORY_LABELS.get(category, {}).get("de", category)
+        prio_label = PRIORITY_LABELS.get(priority, {}).get("de", priority)
+
+        description = task.description
+        summary_parts = [f"[{cat_label}]", task.name]
+        desc_parts = [
+            f"Priorität: {prio_label}",
+            f"Kategorie: {cat_label}",
+        ]
+        if description:
+            desc_parts.append(f"\n{description}")
 
-        return events
+        return _TaskEvents(
+            revision=task.updated_at,
+            summary=" ".join(summary_parts),
+            description="\n".join(desc_parts),
+        )
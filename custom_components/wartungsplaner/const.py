@@ -7,6 +7,7 @@ VERSION = "1.6.5"
 
 # Storage
 STORAGE_KEY = "wartungsplaner.tasks"
+HISTORY_STORAGE_KEY = "wartungsplaner.history"
 STORAGE_VERSION = 1
 
 # Config keys
@@ -16,20 +17,31 @@ CONF_ENABLE_NOTIFICATIONS = "enable_notifications"
 # Defaults
 DEFAULT_DUE_SOON_DAYS = 7
 DEFAULT_ENABLE_NOTIFICATIONS = True
-
-# Update interval (seconds)
-UPDATE_INTERVAL = 3600  # 1 hour
+DEFAULT_SAVE_DELAY = 1  # seconds, write-behind window for storage saves
+DEFAULT_HISTORY_RETENTION = 50  # completions kept in full detail per task
+DEFAULT_ATTRIBUTE_PROFILE = "full"
 
 # Events
 EVENT_TASK_DUE = "wartungsplaner_task_due"
 EVENT_TASK_OVERDUE = "wartungsplaner_task_overdue"
 
+# Dispatcher signals, sent with the set of affected task IDs
+SIGNAL_TASKS_ADDED = f"{DOMAIN}_tasks_added"
+SIGNAL_TASKS_REMOVED = f"{DOMAIN}_tasks_removed"
+
 # Platforms
 PLATFORMS = ["sensor", "binary_sensor", "calendar"]
 
 CARD_URL_PATH = "/wartungsplaner_panel/wartungsplaner-card.js"
 
 
+class AttributeProfile(StrEnum):
+    """Extra state attributes exposed by task entities."""
+
+    FULL = "full"
+    LEAN = "lean"
+
+
 class TaskCategory(StrEnum):
     """Task categories."""
 
@@ -3,24 +3,53 @@
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from collections.abc import Set
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DEFAULT_DUE_SOON_DAYS,
     DOMAIN,
     EVENT_TASK_DUE,
     EVENT_TASK_OVERDUE,
-    UPDATE_INTERVAL,
+    SIGNAL_TASKS_ADDED,
+    SIGNAL_TASKS_REMOVED,
     TaskStatus,
 )
+from .due_index import DueDateIndex
+from .models import Task, TaskState, format_date
+from .status_columns import StatusColumns
 from .store import WartungsplanerStore
+from .task_index import TaskIndex
 
 _LOGGER = logging.getLogger(__name__)
 
+STATS_KEYS = (
+    "total",
+    "overdue",
+    "due_soon",
+    "due",
+    "done",
+    "never_done",
+    "snoozed",
+)
+
+
+@dataclass(slots=True)
+class TaskChanges:
+    """Task IDs touched by the most recent coordinator update."""
+
+    added: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
 
 class WartungsplanerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage task data and status computation."""
@@ -35,34 +64,45 @@ class WartungsplanerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # No polling: refreshes are driven by mutations and the
+            # day-change timer armed in _async_schedule_transition
+            update_interval=None,
         )
         self.store = store
-        self._previous_statuses: dict[str, str] = {}
+        self._previous_statuses: dict[str, TaskStatus] = {}
+        self._task_data: dict[str, TaskState] = {}
+        self._stats: dict[str, int] = dict.fromkeys(STATS_KEYS, 0)
+        self._category_stats: dict[str, dict[str, int]] = {}
+        self._task_categories: dict[str, str] = {}
+        self._status_index = TaskIndex()
+        self._computed_for: tuple[date, int] | None = None
+        self._due_index = DueDateIndex()
+        self._columns = StatusColumns()
+        self._next_transition: datetime | None = None
+        self._unsub_transition: CALLBACK_TYPE | None = None
+        self._task_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self.refreshes_avoided = 0
+        self.last_changes = TaskChanges()
 
     @property
     def due_soon_days(self) -> int:
         """Return due_soon_days from store settings."""
         return self.store.settings.get("due_soon_days", DEFAULT_DUE_SOON_DAYS)
 
-    def _compute_task_status(self, task: dict[str, Any]) -> str:
+    def _compute_task_status(
+        self,
+        next_due: date | None,
+        snoozed_until: date | None,
+        today: date,
+    ) -> TaskStatus:
         """Compute the current status of a task."""
-        today = date.today()
-
         # Check if task is snoozed
-        snoozed_until_str = task.get("snoozed_until")
-        if snoozed_until_str:
-            snoozed_until = date.fromisoformat(snoozed_until_str)
-            if snoozed_until > today:
-                return TaskStatus.SNOOZED
+        if snoozed_until is not None and snoozed_until > today:
+            return TaskStatus.SNOOZED
 
-        next_due_str = task.get("next_due")
-
-        if next_due_str is None:
+        if next_due is None:
             return TaskStatus.NEVER_DONE
 
-        next_due = date.fromisoformat(next_due_str)
-
         if next_due < today:
             return TaskStatus.OVERDUE
         if next_due == today:
@@ -72,84 +112,320 @@ class WartungsplanerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return TaskStatus.DONE
 
-    def _compute_days_until_due(self, task: dict[str, Any]) -> int | None:
+    def _compute_days_until_due(
+        self, next_due: date | None, today: date
+    ) -> int | None:
         """Compute days until a task is due."""
-        next_due_str = task.get("next_due")
-        if next_due_str is None:
+        if next_due is None:
             return None
-        next_due = date.fromisoformat(next_due_str)
-        return (next_due - date.today()).days
+        return (next_due - today).days
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch and compute task data."""
-        tasks = self.store.tasks
-        task_data: dict[str, Any] = {}
-        stats = {
-            "total": 0,
-            "overdue": 0,
-            "due_soon": 0,
-            "due": 0,
-            "done": 0,
-            "never_done": 0,
-            "snoozed": 0,
+        """Fetch and compute task data.
+
+        Only tasks reported as changed by the store are recomputed. All tasks
+        are re-evaluated when the day rolls over or due_soon_days changes,
+        because that shifts every status and days_until_due value. That full
+        pass runs over the status columns in one go instead of per task.
+        """
+        today = dt_util.now().date()
+        try:
+            return self._compute_data(today)
+        finally:
+            # Re-armed even if computing failed, so the day change is not lost
+            self._async_schedule_transition(today)
+
+    def _compute_data(self, today: date) -> dict[str, Any]:
+        """Recompute changed tasks, or all tasks on a new day."""
+        changed_ids = self.store.async_pop_changed_task_ids()
+
+        computed_for = (today, self.due_soon_days)
+        if computed_for != self._computed_for:
+            tasks = self.store.tasks
+            if self._computed_for is None:
+                changed_ids = set(tasks)
+            self._computed_for = computed_for
+            previous = self._task_data
+            self._task_data = {}
+            for task_id in changed_ids:
+                self._sync_columns(task_id, tasks.get(task_id))
+            # Drop bookkeeping for tasks deleted since the last refresh
+            for task_id in changed_ids - tasks.keys():
+                self._previous_statuses.pop(task_id, None)
+                self._status_index.discard(task_id)
+            statuses, days, _ = self._columns.compute(today, self.due_soon_days)
+            # Keep known categories so their counts drop to zero, not vanish
+            for category_counts in self._category_stats.values():
+                category_counts.update(dict.fromkeys(STATS_KEYS, 0))
+            self._task_categories = {}
+            for task_id, status, days_until_due in zip(
+                self._columns.task_ids, statuses, days
+            ):
+                task = tasks[task_id]
+                self._set_state(task_id, task, status, days_until_due)
+                self._count_category(task_id, str(task.category), status)
+            self._due_index.rebuild(
+                (task_id, state.task.next_due)
+                for task_id, state in self._task_data.items()
+            )
+            added = self._task_data.keys() - previous.keys()
+            self.last_changes = TaskChanges(
+                added=added,
+                changed=self._task_data.keys() - added,
+                removed=previous.keys() - self._task_data.keys(),
+            )
+        else:
+            changes = TaskChanges()
+            for task_id in changed_ids:
+                existed = task_id in self._task_data
+                self._update_task(task_id, today)
+                state = self._task_data.get(task_id)
+                self._due_index.update(
+                    task_id, state.task.next_due if state is not None else None
+                )
+                if state is None:
+                    if existed:
+                        changes.removed.add(task_id)
+                elif existed:
+                    changes.changed.add(task_id)
+                else:
+                    changes.added.add(task_id)
+            self.last_changes = changes
+
+        # Status counts come straight from the status index
+        self._stats = {"total": len(self._task_data)}
+        for key in STATS_KEYS[1:]:
+            self._stats[key] = self._status_index.count(key)
+        return {
+            "tasks": self._task_data,
+            "stats": dict(self._stats),
+            "category_stats": {
+                category: dict(counts)
+                for category, counts in self._category_stats.items()
+            },
         }
 
-        for task_id, task in tasks.items():
-            status = self._compute_task_status(task)
-            days_until_due = self._compute_days_until_due(task)
-
-            task_data[task_id] = {
-                **task,
-                "status": status,
-                "days_until_due": days_until_due,
-            }
-
-            stats["total"] += 1
-            if status == TaskStatus.OVERDUE:
-                stats["overdue"] += 1
-            elif status == TaskStatus.DUE_SOON:
-                stats["due_soon"] += 1
-            elif status == TaskStatus.DUE:
-                stats["due"] += 1
-            elif status == TaskStatus.DONE:
-                stats["done"] += 1
-            elif status == TaskStatus.NEVER_DONE:
-                stats["never_done"] += 1
-            elif status == TaskStatus.SNOOZED:
-                stats["snoozed"] += 1
-
-            # Fire events on status transitions
-            prev_status = self._previous_statuses.get(task_id)
-            if prev_status is not None and prev_status != status:
-                if status == TaskStatus.DUE:
-                    self.hass.bus.async_fire(
-                        EVENT_TASK_DUE,
-                        {
-                            "task_id": task_id,
-                            "task_name": task["name"],
-                            "category": task["category"],
-                            "priority": task["priority"],
-                            "next_due": task["next_due"],
-                        },
-                    )
-                elif status == TaskStatus.OVERDUE:
-                    self.hass.bus.async_fire(
-                        EVENT_TASK_OVERDUE,
-                        {
-                            "task_id": task_id,
-                            "task_name": task["name"],
-                            "category": task["category"],
-                            "priority": task["priority"],
-                            "next_due": task["next_due"],
-                        },
-                    )
-
-            self._previous_statuses[task_id] = status
-
-        # Clean up removed tasks from previous statuses
-        current_ids = set(tasks.keys())
-        for old_id in list(self._previous_statuses.keys()):
-            if old_id not in current_ids:
-                del self._previous_statuses[old_id]
-
-        return {"tasks": task_data, "stats": stats}
+    @callback
+    def async_add_task_listener(
+        self, task_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that add, change or remove one task."""
+        listeners = self._task_listeners.setdefault(task_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the task listener."""
+            listeners.remove(update_callback)
+            if not listeners and self._task_listeners.get(task_id) is listeners:
+                del self._task_listeners[task_id]
+
+        return remove_listener
+
+    @callback
+    def async_update_all_task_listeners(self) -> None:
+        """Notify the listeners of every task, e.g. after a settings change."""
+        for listeners in list(self._task_listeners.values()):
+            for update_callback in list(listeners):
+                update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, and task listeners of the touched tasks only.
+
+        Added and removed tasks are also announced with dispatcher signals,
+        which the platforms use to create and remove entities.
+        """
+        super().async_update_listeners()
+        if not self.last_update_success:
+            return
+        changes = self.last_changes
+        if changes.added:
+            async_dispatcher_send(self.hass, SIGNAL_TASKS_ADDED, changes.added)
+        if changes.removed:
+            async_dispatcher_send(self.hass, SIGNAL_TASKS_REMOVED, changes.removed)
+        if not self._task_listeners:
+            return
+        for task_id in changes.added | changes.changed | changes.removed:
+            for update_callback in list(self._task_listeners.get(task_id, ())):
+                update_callback()
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the cached data no longer reflects the store.
+
+        The snapshot is fresh as long as no task changed since the last
+        refresh and neither the day nor due_soon_days changed.
+        """
+        return (
+            self.data is None
+            or self.store.has_changed_tasks
+            or self._computed_for != (dt_util.now().date(), self.due_soon_days)
+        )
+
+    async def async_ensure_fresh(self) -> None:
+        """Refresh only if the cached data is stale."""
+        if self.is_stale:
+            await self.async_refresh()
+            return
+        self.refreshes_avoided += 1
+
+    @property
+    def due_index(self) -> DueDateIndex:
+        """Return the index of tasks ordered by next due date."""
+        return self._due_index
+
+    def get_task_ids_by_status(self, status: str) -> Set[str]:
+        """Return the IDs of tasks with a status."""
+        return self._status_index.get(status)
+
+    def _snapshots(self, task_ids: list[str]) -> list[TaskState]:
+        """Return computed task states for a list of task IDs."""
+        return [self._task_data[task_id] for task_id in task_ids]
+
+    def get_next_due_task(self, on_or_after: date) -> TaskState | None:
+        """Return the first task due on or after a day."""
+        task_id = self._due_index.first_on_or_after(on_or_after)
+        if task_id is None:
+            return None
+        return self._task_data[task_id]
+
+    def get_overdue_tasks(
+        self, today: date, limit: int | None = None
+    ) -> list[TaskState]:
+        """Return tasks due before today, most overdue first."""
+        return self._snapshots(self._due_index.due_before(today, limit))
+
+    def get_tasks_due_between(
+        self, start: date | None, end: date | None, limit: int | None = None
+    ) -> list[TaskState]:
+        """Return tasks due in [start, end), earliest first."""
+        return self._snapshots(self._due_index.due_between(start, end, limit))
+
+    @callback
+    def _async_schedule_transition(self, today: date) -> None:
+        """Arm a single timer for the next moment any task can change.
+
+        Status and days_until_due only depend on the calendar day, so the
+        next change is at local midnight, provided at least one task has a
+        due date. Tasks that were never done do not change on their own.
+        """
+        next_transition: datetime | None = None
+        if self._stats["total"] > self._stats["never_done"]:
+            next_transition = dt_util.start_of_local_day(
+                today + timedelta(days=1)
+            )
+
+        if next_transition == self._next_transition:
+            return
+
+        self._async_cancel_transition()
+        self._next_transition = next_transition
+        if next_transition is None:
+            return
+
+        self._unsub_transition = async_track_point_in_time(
+            self.hass, self._async_handle_transition, next_transition
+        )
+        _LOGGER.debug("Next status transition scheduled for %s", next_transition)
+
+    @callback
+    def _async_cancel_transition(self) -> None:
+        """Cancel the pending transition timer."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+        self._next_transition = None
+
+    @callback
+    def _async_handle_transition(self, _now: datetime) -> None:
+        """Refresh when the day changes."""
+        self._unsub_transition = None
+        self._next_transition = None
+        self.hass.async_create_task(self.async_refresh())
+
+    async def async_shutdown(self) -> None:
+        """Cancel the transition timer and shut down the coordinator."""
+        self._async_cancel_transition()
+        await super().async_shutdown()
+
+    @property
+    def status_backend(self) -> str:
+        """Return the backend used for full status passes."""
+        return self._columns.backend
+
+    def _sync_columns(self, task_id: str, task: Task | None) -> None:
+        """Copy the dates of a task into the status columns."""
+        if task is None:
+            self._columns.discard(task_id)
+        else:
+            self._columns.set(task_id, task.next_due, task.snoozed_until)
+
+    def _update_task(self, task_id: str, today: date) -> None:
+        """Recompute a single task and adjust the category counters."""
+        old = self._task_data.pop(task_id, None)
+        if old is not None:
+            # The task object may already carry its new category
+            old_category = self._task_categories.pop(task_id)
+            self._category_stats[old_category]["total"] -= 1
+            self._category_stats[old_category][old.status] -= 1
+
+        task = self.store.tasks.get(task_id)
+        self._sync_columns(task_id, task)
+        if task is None:
+            self._previous_statuses.pop(task_id, None)
+            self._status_index.discard(task_id)
+            return
+
+        status = self._compute_task_status(task.next_due, task.snoozed_until, today)
+        days_until_due = self._compute_days_until_due(task.next_due, today)
+        self._set_state(task_id, task, status, days_until_due)
+        self._count_category(task_id, str(task.category), status)
+
+    def _count_category(self, task_id: str, category: str, status: str) -> None:
+        """Add a task to the counters of its category."""
+        self._task_categories[task_id] = category
+        counts = self._category_stats.get(category)
+        if counts is None:
+            counts = self._category_stats[category] = dict.fromkeys(STATS_KEYS, 0)
+        counts["total"] += 1
+        counts[status] += 1
+
+    def _set_state(
+        self,
+        task_id: str,
+        task: Task,
+        status: TaskStatus,
+        days_until_due: int | None,
+    ) -> None:
+        """Store the computed state of a task and fire transition events."""
+        self._task_data[task_id] = TaskState(task, status, days_until_due)
+        self._status_index.set(task_id, status)
+
+        # Fire events on status transitions
+        prev_status = self._previous_statuses.get(task_id)
+        if prev_status is not None and prev_status != status:
+            if status == TaskStatus.DUE:
+                self.hass.bus.async_fire(
+                    EVENT_TASK_DUE,
+                    {
+                        "task_id": task_id,
+                        "task_name": task.name,
+                        "category": task.category,
+                        "priority": task.priority,
+                        "next_due": format_date(task.next_due),
+                    },
+                )
+            elif status == TaskStatus.OVERDUE:
+                self.hass.bus.async_fire(
+                    EVENT_TASK_OVERDUE,
+                    {
+                        "task_id": task_id,
+                        "task_name": task.name,
+                        "category": task.category,
+                        "priority": task.priority,
+                        "next_due": format_date(task.next_due),
+                    },
+                )
+
+        self._previous_statuses[task_id] = status
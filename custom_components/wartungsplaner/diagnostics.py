@@ -0,0 +1,32 @@
+"""Diagnostics support for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    store = hass.data[DOMAIN]["store"]
+    coordinator = hass.data[DOMAIN]["coordinator"]
+
+    return {
+        "task_count": len(store.tasks),
+        "settings": store.settings,
+        "storage": {
+            "save_delay": store.save_delay,
+            "shards": store.shard_count,
+            **store.save_stats,
+        },
+        "coordinator": {
+            "refreshes_avoided": coordinator.refreshes_avoided,
+            "status_backend": coordinator.status_backend,
+        },
+    }
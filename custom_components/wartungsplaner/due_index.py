@@ -0,0 +1,86 @@
+"""Due-date index for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from datetime import date
+
+
+class DueDateIndex:
+    """Keep task IDs ordered by their next due date.
+
+    Entries are (next_due, task_id) tuples. Lookups use binary search; tasks
+    without a due date are not indexed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: list[tuple[date, str]] = []
+        self._due_by_task: dict[str, date] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._entries)
+
+    def rebuild(self, items: Iterable[tuple[str, date | None]]) -> None:
+        """Replace the index contents with (task_id, next_due) pairs."""
+        self._due_by_task = {
+            task_id: next_due for task_id, next_due in items if next_due
+        }
+        self._entries = sorted(
+            (next_due, task_id) for task_id, next_due in self._due_by_task.items()
+        )
+
+    def update(self, task_id: str, next_due: date | None) -> None:
+        """Insert, move or remove a task."""
+        old_due = self._due_by_task.get(task_id)
+        if old_due == next_due:
+            return
+        if old_due is not None:
+            self.discard(task_id)
+        if next_due:
+            self._due_by_task[task_id] = next_due
+            insort(self._entries, (next_due, task_id))
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task if it is indexed."""
+        old_due = self._due_by_task.pop(task_id, None)
+        if old_due is None:
+            return
+        pos = bisect_left(self._entries, (old_due, task_id))
+        del self._entries[pos]
+
+    def first_on_or_after(self, day: date) -> str | None:
+        """Return the ID of the first task due on or after a day."""
+        pos = bisect_left(self._entries, (day, ""))
+        if pos == len(self._entries):
+            return None
+        return self._entries[pos][1]
+
+    def last(self) -> str | None:
+        """Return the ID of the task with the latest due date."""
+        if not self._entries:
+            return None
+        return self._entries[-1][1]
+
+    def due_before(self, day: date, limit: int | None = None) -> list[str]:
+        """Return IDs of tasks due before a day, earliest first."""
+        end = bisect_left(self._entries, (day, ""))
+        if limit is not None:
+            end = min(end, limit)
+        return [task_id for _, task_id in self._entries[:end]]
+
+    def due_between(
+        self, start: date | None, end: date | None, limit: int | None = None
+    ) -> list[str]:
+        """Return IDs of tasks due in [start, end), earliest first."""
+        lo = 0 if start is None else bisect_left(self._entries, (start, ""))
+        hi = (
+            len(self._entries)
+            if end is None
+            else bisect_left(self._entries, (end, ""))
+        )
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [task_id for _, task_id in self._entries[lo:hi]]
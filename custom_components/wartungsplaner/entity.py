@@ -0,0 +1,126 @@
+"""Base entity for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_TASKS_ADDED, SIGNAL_TASKS_REMOVED
+from .coordinator import WartungsplanerCoordinator
+from .models import TaskState
+
+
+@callback
+def async_setup_task_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    platform: str,
+    entity_class: type[WartungsplanerTaskEntity],
+) -> None:
+    """Add an entity per task and follow tasks being added and removed.
+
+    Plain refreshes do no work here; only the coordinator's added and
+    removed notifications create entities or clean up the registry.
+    """
+    coordinator: WartungsplanerCoordinator = hass.data[DOMAIN]["coordinator"]
+
+    @callback
+    def _async_add_entities(task_ids: set[str]) -> None:
+        """Add entities for new tasks."""
+        async_add_entities(
+            [entity_class(coordinator, task_id) for task_id in task_ids]
+        )
+
+    @callback
+    def _async_remove_entities(task_ids: set[str]) -> None:
+        """Remove the registry entries of deleted tasks in one go."""
+        ent_reg = er.async_get(hass)
+        for task_id in task_ids:
+            entity_id = ent_reg.async_get_entity_id(
+                platform, DOMAIN, f"{entity_class.unique_id_prefix}{task_id}"
+            )
+            if entity_id:
+                ent_reg.async_remove(entity_id)
+
+    if coordinator.data is not None:
+        _async_add_entities(set(coordinator.data["tasks"]))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_TASKS_ADDED, _async_add_entities)
+    )
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_TASKS_REMOVED, _async_remove_entities)
+    )
+
+
+class WartungsplanerTaskEntity(Entity):
+    """Base class for entities that represent a single task.
+
+    Instead of listening to every coordinator update, the entity subscribes
+    to updates of its own task and only writes its state when the state or
+    attributes actually changed.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    unique_id_prefix: ClassVar[str]
+
+    def __init__(
+        self,
+        coordinator: WartungsplanerCoordinator,
+        task_id: str,
+    ) -> None:
+        """Initialize the entity."""
+        self.coordinator = coordinator
+        self._task_id = task_id
+        self._attr_unique_id = f"{self.unique_id_prefix}{task_id}"
+        self._written: tuple[Any, ...] | None = None
+
+    @property
+    def _task_data(self) -> TaskState | None:
+        """Get the current task state from coordinator."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("tasks", {}).get(self._task_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the task still exists."""
+        return self._task_data is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates of this task."""
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this
+        self._written = self._state_snapshot()
+        self.async_on_remove(
+            self.coordinator.async_add_task_listener(
+                self._task_id, self._handle_task_update
+            )
+        )
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return everything that ends up in the written state."""
+        return (
+            self.available,
+            self.state,
+            self.name,
+            self.icon,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _handle_task_update(self) -> None:
+        """Write the state if the task update changed it."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._written:
+            return
+        self._written = snapshot
+        self.async_write_ha_state()
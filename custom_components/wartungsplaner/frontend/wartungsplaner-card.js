@@ -87,8 +87,8 @@ class WartungsplanerCard extends HTMLElement {
     this._data = null;
     this._categories = null;
     this._lang = "de";
-    this._lastLoad = 0;
-    this._loading = false;
+    this._unsubTasks = null;
+    this._lastSubscribeAttempt = 0;
   }
 
   static getConfigElement() {
@@ -123,34 +123,60 @@ class WartungsplanerCard extends HTMLElement {
     this._hass = hass;
     this._lang = (hass.language || "de").startsWith("en") ? "en" : "de";
 
-    const now = Date.now();
-    if (now - this._lastLoad > 30000 && !this._loading) {
-      this._loadData();
+    if (this.isConnected) {
+      this._subscribe();
     }
   }
 
+  connectedCallback() {
+    if (this._hass) {
+      this._subscribe();
+    }
+  }
+
+  disconnectedCallback() {
+    if (this._unsubTasks) {
+      this._unsubTasks.then((unsub) => unsub()).catch(() => {});
+      this._unsubTasks = null;
+    }
+    this._lastSubscribeAttempt = 0;
+  }
+
   get _t() {
     return CARD_STRINGS[this._lang] || CARD_STRINGS.de;
   }
 
-  async _loadData() {
-    if (!this._hass) return;
-    this._loading = true;
-    this._lastLoad = Date.now();
+  _subscribe() {
+    if (this._unsubTasks || Date.now() - this._lastSubscribeAttempt < 30000) return;
+    this._lastSubscribeAttempt = Date.now();
+    this._hass
+      .callWS({ type: "wartungsplaner/get_categories" })
+      .then((result) => {
+        this._categories = result.categories;
+        if (this._data) this._render();
+      })
+      .catch(() => {});
+    this._unsubTasks = this._hass.connection.subscribeMessage(
+      (msg) => this._handleTaskMessage(msg),
+      { type: "wartungsplaner/subscribe" }
+    );
+    this._unsubTasks.catch(() => {
+      // Integration may not be loaded yet; retry on a later hass update
+      this._unsubTasks = null;
+    });
+  }
 
-    try {
-      const [taskResult, catResult] = await Promise.all([
-        this._hass.callWS({ type: "wartungsplaner/get_tasks" }),
-        this._hass.callWS({ type: "wartungsplaner/get_categories" }),
-      ]);
-      this._data = taskResult;
-      this._categories = catResult.categories;
-      this._render();
-    } catch (e) {
-      // Integration may not be loaded yet
-    } finally {
-      this._loading = false;
+  _handleTaskMessage(msg) {
+    if (msg.type === "snapshot") {
+      this._data = { tasks: msg.tasks || {}, stats: msg.stats || {} };
+    } else {
+      Object.assign(this._data.tasks, msg.added, msg.changed);
+      for (const taskId of msg.removed) {
+        delete this._data.tasks[taskId];
+      }
+      Object.assign(this._data.stats, msg.stats);
     }
+    this._render();
   }
 
   _getCategoryLabel(categoryId) {
@@ -183,8 +209,6 @@ class WartungsplanerCard extends HTMLElement {
         type: "wartungsplaner/complete_task",
         task_id: taskId,
       });
-      this._lastLoad = 0;
-      await this._loadData();
     } catch (e) {
       // Ignore
     }
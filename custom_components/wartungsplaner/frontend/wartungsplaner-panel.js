@@ -50,6 +50,9 @@ const STRINGS = {
     never: "Nie",
     settings: "Einstellungen",
     dueSoonDays: "Tage vor Fälligkeit als 'Bald fällig'",
+    attributeProfile: "Sensor-Attribute",
+    attributeProfileFull: "Vollständig",
+    attributeProfileLean: "Schlank (nur Status und Fälligkeit)",
     manageCategories: "Kategorien verwalten",
     addCategory: "Kategorie hinzufügen",
     deleteCategory: "Kategorie löschen",
@@ -143,6 +146,9 @@ const STRINGS = {
     never: "Never",
     settings: "Settings",
     dueSoonDays: "Days before due to mark as 'due soon'",
+    attributeProfile: "Sensor attributes",
+    attributeProfileFull: "Full",
+    attributeProfileLean: "Lean (status and due date only)",
     manageCategories: "Manage Categories",
     addCategory: "Add Category",
     deleteCategory: "Delete Category",
@@ -215,12 +221,15 @@ class WartungsplanerPanel extends HTMLElement {
     this._hass = null;
     this._tasks = {};
     this._stats = {};
+    this._unsubTasks = null;
     this._templates = [];
+    this._templatesVersion = null;
     this._categories = [];
     this._activeTab = "overview";
     this._filterCategory = "all";
     this._filterStatus = "all";
     this._searchQuery = "";
+    this._searchIds = null;
     this._hiddenTemplateCount = 0;
     this._settings = { due_soon_days: 7 };
     this._lang = "de";
@@ -233,7 +242,7 @@ class WartungsplanerPanel extends HTMLElement {
     }
     if (!this._initialized && this.isConnected) {
       this._initialized = true;
-      Promise.all([this._loadCategories(), this._loadSettings()]).then(() => this._loadData());
+      Promise.all([this._loadCategories(), this._loadSettings()]).then(() => this._subscribeTasks());
     }
   }
 
@@ -267,7 +276,7 @@ class WartungsplanerPanel extends HTMLElement {
     // Reload data when re-attached to the DOM (e.g. after tab switch)
     if (this._hass) {
       this._initialized = true;
-      Promise.all([this._loadCategories(), this._loadSettings()]).then(() => this._loadData());
+      Promise.all([this._loadCategories(), this._loadSettings()]).then(() => this._subscribeTasks());
     } else {
       this._initialized = false;
       this._render();
@@ -276,6 +285,7 @@ class WartungsplanerPanel extends HTMLElement {
 
   disconnectedCallback() {
     this._initialized = false;
+    this._unsubscribeTasks();
   }
 
   async _loadCategories() {
@@ -298,24 +308,91 @@ class WartungsplanerPanel extends HTMLElement {
     }
   }
 
-  async _loadData() {
-    if (!this._hass) return;
+  _subscribeTasks() {
+    if (!this._hass || this._unsubTasks) return;
+    this._unsubTasks = this._hass.connection.subscribeMessage(
+      (msg) => this._handleTaskMessage(msg),
+      { type: "wartungsplaner/subscribe" }
+    );
+    this._unsubTasks.catch((e) => {
+      console.error("Wartungsplaner: Failed to subscribe to tasks", e);
+      this._unsubTasks = null;
+    });
+  }
+
+  _unsubscribeTasks() {
+    if (!this._unsubTasks) return;
+    this._unsubTasks.then((unsub) => unsub()).catch(() => {});
+    this._unsubTasks = null;
+  }
+
+  _handleTaskMessage(msg) {
+    if (msg.type === "snapshot") {
+      this._tasks = msg.tasks || {};
+      this._stats = msg.stats || {};
+    } else {
+      Object.assign(this._tasks, msg.added, msg.changed);
+      for (const taskId of msg.removed) {
+        delete this._tasks[taskId];
+      }
+      Object.assign(this._stats, msg.stats);
+    }
+    // Changed names or descriptions can change the search results
+    if (this._searchQuery) {
+      this._searchTasks();
+    }
+    this._renderKeepingSearchFocus();
+  }
+
+  async _searchTasks() {
+    const query = this._searchQuery;
+    if (!query.trim()) {
+      this._searchIds = null;
+      this._renderKeepingSearchFocus();
+      return;
+    }
     try {
-      const result = await this._hass.callWS({ type: "wartungsplaner/get_tasks" });
-      this._tasks = result.tasks || {};
-      this._stats = result.stats || {};
-      this._render();
+      const result = await this._hass.callWS({
+        type: "wartungsplaner/search",
+        query,
+        fields: ["id"],
+      });
+      // Ignore answers to queries the user already typed past
+      if (query !== this._searchQuery) return;
+      this._searchIds = new Set(result.results.map((match) => match.task.id));
     } catch (e) {
-      console.error("Wartungsplaner: Failed to load tasks", e);
+      console.error("Wartungsplaner: Failed to search tasks", e);
+      return;
+    }
+    this._renderKeepingSearchFocus();
+  }
+
+  _renderKeepingSearchFocus() {
+    // Re-rendering replaces the search field, so keep focus while typing
+    const active = this.shadowRoot.activeElement;
+    const searchFocused = active && active.id === "searchInput";
+    const pos = searchFocused ? active.selectionStart : null;
+    this._render();
+    if (searchFocused) {
+      const newInput = this.shadowRoot.getElementById("searchInput");
+      if (newInput) {
+        newInput.focus();
+        newInput.setSelectionRange(pos, pos);
+      }
     }
   }
 
   async _loadTemplates() {
     if (!this._hass) return;
     try {
-      const result = await this._hass.callWS({ type: "wartungsplaner/get_templates" });
+      const request = { type: "wartungsplaner/get_templates" };
+      if (this._templatesVersion) request.version = this._templatesVersion;
+      const result = await this._hass.callWS(request);
+      if (result.unchanged) return false;
       this._templates = result.templates || [];
       this._hiddenTemplateCount = result.hidden_count || 0;
+      this._templatesVersion = result.version || null;
+      return true;
     } catch (e) {
       console.error("Wartungsplaner: Failed to load templates", e);
     }
@@ -323,6 +400,10 @@ class WartungsplanerPanel extends HTMLElement {
 
   _render() {
     const t = this.t;
+    // Pushed updates can arrive while a dialog or toast is open; keep them
+    const overlays = Array.from(this.shadowRoot.children).filter(
+      (el) => el.classList.contains("toast") || el.querySelector(".dialog-overlay")
+    );
     this.shadowRoot.innerHTML = `
       <style>${this._getStyles()}</style>
       <div class="container">
@@ -348,6 +429,7 @@ class WartungsplanerPanel extends HTMLElement {
         </div>
       </div>
     `;
+    overlays.forEach((el) => this.shadowRoot.appendChild(el));
     this._attachEventListeners();
   }
 
@@ -432,14 +514,8 @@ class WartungsplanerPanel extends HTMLElement {
     if (this._filterStatus !== "all") {
       tasks = tasks.filter((task) => task.status === this._filterStatus);
     }
-    if (this._searchQuery) {
-      const q = this._searchQuery.toLowerCase();
-      tasks = tasks.filter(
-        (task) =>
-          task.name.toLowerCase().includes(q) ||
-          (task.description && task.description.toLowerCase().includes(q)) ||
-          (task.manufacturer && task.manufacturer.toLowerCase().includes(q))
-      );
+    if (this._searchQuery && this._searchIds) {
+      tasks = tasks.filter((task) => this._searchIds.has(task.id));
     }
 
     tasks.sort((a, b) => {
@@ -641,10 +717,14 @@ class WartungsplanerPanel extends HTMLElement {
     root.querySelectorAll(".tab").forEach((tab) => {
       tab.addEventListener("click", (e) => {
         this._activeTab = tab.dataset.tab;
-        if (this._activeTab === "templates" && this._templates.length === 0) {
+        if (this._activeTab === "templates" && !this._templatesVersion) {
           this._loadTemplates().then(() => this._render());
         } else {
           this._render();
+          // Cheap revalidation: the server only answers "unchanged" if current
+          if (this._activeTab === "templates") {
+            this._loadTemplates().then((updated) => updated && this._render());
+          }
         }
       });
     });
@@ -670,13 +750,7 @@ class WartungsplanerPanel extends HTMLElement {
     if (searchInput) {
       searchInput.addEventListener("input", (e) => {
         this._searchQuery = e.target.value;
-        const pos = e.target.selectionStart;
-        this._render();
-        const newInput = this.shadowRoot.getElementById("searchInput");
-        if (newInput) {
-          newInput.focus();
-          newInput.setSelectionRange(pos, pos);
-        }
+        this._searchTasks();
       });
     }
 
@@ -917,7 +991,6 @@ class WartungsplanerPanel extends HTMLElement {
           });
         }
         dialog.remove();
-        await this._loadData();
       } catch (e) {
         console.error("Wartungsplaner: Failed to save task", e);
       }
@@ -961,7 +1034,6 @@ class WartungsplanerPanel extends HTMLElement {
           notes,
         });
         dialog.remove();
-        await this._loadData();
       } catch (e) {
         console.error("Wartungsplaner: Failed to complete task", e);
       }
@@ -1000,7 +1072,6 @@ class WartungsplanerPanel extends HTMLElement {
           task_id: taskId,
         });
         dialog.remove();
-        await this._loadData();
       } catch (e) {
         console.error("Wartungsplaner: Failed to delete task", e);
       }
@@ -1059,7 +1130,6 @@ class WartungsplanerPanel extends HTMLElement {
           });
           console.log("Wartungsplaner: Snooze result", result);
           dialog.remove();
-          await this._loadData();
         } catch (e) {
           console.error("Wartungsplaner: Failed to snooze task", e);
           this._showToast(this._lang === "de" ? "Aufschieben fehlgeschlagen" : "Snooze failed");
@@ -1116,6 +1186,13 @@ class WartungsplanerPanel extends HTMLElement {
             <label>${t.dueSoonDays}</label>
             <input type="number" id="settingDueSoonDays" min="1" max="90" value="${this._settings.due_soon_days || 7}" />
           </div>
+          <div class="form-group">
+            <label>${t.attributeProfile}</label>
+            <select id="settingAttributeProfile">
+              <option value="full" ${this._settings.attribute_profile !== "lean" ? "selected" : ""}>${t.attributeProfileFull}</option>
+              <option value="lean" ${this._settings.attribute_profile === "lean" ? "selected" : ""}>${t.attributeProfileLean}</option>
+            </select>
+          </div>
           <div class="form-group">
             <label>${t.conversationAgent} <span class="hint">(${t.conversationAgentHint})</span></label>
             <select id="settingConversationAgent">
@@ -1178,6 +1255,7 @@ class WartungsplanerPanel extends HTMLElement {
     const saveSettingsAndClose = async () => {
       const dueSoonDays = parseInt(dialog.querySelector("#settingDueSoonDays").value, 10);
       const agentId = dialog.querySelector("#settingConversationAgent").value;
+      const attributeProfile = dialog.querySelector("#settingAttributeProfile").value;
       const settingsToUpdate = {};
       if (dueSoonDays >= 1 && dueSoonDays <= 90 && dueSoonDays !== this._settings.due_soon_days) {
         settingsToUpdate.due_soon_days = dueSoonDays;
@@ -1185,6 +1263,9 @@ class WartungsplanerPanel extends HTMLElement {
       if (agentId !== (this._settings.conversation_agent_id || "")) {
         settingsToUpdate.conversation_agent_id = agentId;
       }
+      if (attributeProfile !== (this._settings.attribute_profile || "full")) {
+        settingsToUpdate.attribute_profile = attributeProfile;
+      }
       if (Object.keys(settingsToUpdate).length > 0) {
         try {
           await this._hass.callWS({
@@ -1192,7 +1273,6 @@ class WartungsplanerPanel extends HTMLElement {
             ...settingsToUpdate,
           });
           Object.assign(this._settings, settingsToUpdate);
-          await this._loadData();
         } catch (e) {
           console.error("Wartungsplaner: Failed to save settings", e);
         }
@@ -1249,8 +1329,6 @@ class WartungsplanerPanel extends HTMLElement {
         interval_value: task.interval_value,
         interval_unit: task.interval_unit,
       });
-      // Reload templates so next visit to templates tab shows the new one
-      this._templates = [];
       this._showToast(this.t.templateSaved);
     } catch (e) {
       console.error("Wartungsplaner: Failed to save as template", e);
@@ -1298,7 +1376,6 @@ class WartungsplanerPanel extends HTMLElement {
         type: "wartungsplaner/add_from_template",
         template_id: templateId,
       });
-      await this._loadData();
       this._activeTab = "tasks";
       this._render();
     } catch (e) {
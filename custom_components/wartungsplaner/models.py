@@ -0,0 +1,143 @@
+"""Data models for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from .const import IntervalUnit, TaskCategory, TaskPriority, TaskStatus
+
+
+_EnumT = TypeVar("_EnumT", bound=StrEnum)
+
+
+def _coerce_enum(enum_cls: type[_EnumT], value: str) -> _EnumT | str:
+    """Return the enum member for a value, or the raw string if unknown.
+
+    Custom categories and values written by older versions are kept as is.
+    """
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
+def parse_date(value: str | date | None) -> date | None:
+    """Parse an ISO date string, returning None for empty values."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def format_date(value: date | None) -> str | None:
+    """Format a date as ISO string, keeping None."""
+    return value.isoformat() if value is not None else None
+
+
+@dataclass(slots=True)
+class Task:
+    """A maintenance task.
+
+    Dates are kept as date objects and categorical fields as enums. The JSON
+    layout used in storage and the WebSocket API is produced by as_dict.
+    """
+
+    id: str
+    name: str
+    description: str
+    manufacturer: str
+    category: TaskCategory | str
+    priority: TaskPriority | str
+    interval_value: int
+    interval_unit: IntervalUnit | str
+    last_completed: date | None
+    next_due: date | None
+    snoozed_until: date | None
+    completion_count: int
+    created_at: str
+    updated_at: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Task:
+        """Create a task from its stored representation."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data.get("description", ""),
+            manufacturer=data.get("manufacturer", ""),
+            category=_coerce_enum(TaskCategory, data.get("category", "other")),
+            priority=_coerce_enum(TaskPriority, data.get("priority", "medium")),
+            interval_value=data.get("interval_value", 1),
+            interval_unit=_coerce_enum(
+                IntervalUnit, data.get("interval_unit", "months")
+            ),
+            last_completed=parse_date(data.get("last_completed")),
+            next_due=parse_date(data.get("next_due")),
+            snoozed_until=parse_date(data.get("snoozed_until")),
+            completion_count=data.get("completion_count", 0),
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", ""),
+        )
+
+    @staticmethod
+    def parse_field(key: str, value: Any) -> Any:
+        """Return a field value parsed from its JSON representation.
+
+        Raises ValueError for invalid dates.
+        """
+        if key == "category":
+            return _coerce_enum(TaskCategory, value)
+        if key == "priority":
+            return _coerce_enum(TaskPriority, value)
+        if key == "interval_unit":
+            return _coerce_enum(IntervalUnit, value)
+        if key in ("last_completed", "next_due", "snoozed_until"):
+            return parse_date(value)
+        return value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON representation used in storage and the API."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "manufacturer": self.manufacturer,
+            "category": self.category,
+            "priority": self.priority,
+            "interval_value": self.interval_value,
+            "interval_unit": self.interval_unit,
+            "last_completed": format_date(self.last_completed),
+            "completion_count": self.completion_count,
+            "next_due": format_date(self.next_due),
+            "snoozed_until": format_date(self.snoozed_until),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+@dataclass(slots=True)
+class TaskState:
+    """A task together with its computed status."""
+
+    task: Task
+    status: TaskStatus
+    days_until_due: int | None
+    _dict: dict[str, Any] | None = field(default=None, repr=False, compare=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the JSON representation sent to the frontend.
+
+        Task states are replaced whenever a task changes, so the result is
+        built once and reused.
+        """
+        if self._dict is None:
+            self._dict = {
+                **self.task.as_dict(),
+                "status": self.status,
+                "days_until_due": self.days_until_due,
+            }
+        return self._dict
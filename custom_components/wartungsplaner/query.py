@@ -0,0 +1,182 @@
+"""Filtering, sorting and paging of tasks for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Collection, Iterable
+from typing import Any
+
+from .const import TaskPriority, TaskStatus
+from .models import TaskState
+
+# Same order as the task list of the panel
+STATUS_ORDER = {
+    TaskStatus.OVERDUE: 0,
+    TaskStatus.DUE: 1,
+    TaskStatus.NEVER_DONE: 2,
+    TaskStatus.DUE_SOON: 3,
+    TaskStatus.DONE: 4,
+    TaskStatus.SNOOZED: 5,
+}
+PRIORITY_ORDER = {
+    TaskPriority.CRITICAL: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.MEDIUM: 2,
+    TaskPriority.LOW: 3,
+}
+
+TASK_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "manufacturer",
+    "category",
+    "priority",
+    "interval_value",
+    "interval_unit",
+    "last_completed",
+    "completion_count",
+    "next_due",
+    "snoozed_until",
+    "created_at",
+    "updated_at",
+    "status",
+    "days_until_due",
+)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a paging cursor cannot be decoded."""
+
+
+def _status_key(state: TaskState) -> tuple[Any, ...]:
+    """Sort by status, then days until due (missing last)."""
+    days = state.days_until_due
+    return (
+        STATUS_ORDER.get(state.status, len(STATUS_ORDER)),
+        days is None,
+        days or 0,
+        state.task.id,
+    )
+
+
+def _next_due_key(state: TaskState) -> tuple[Any, ...]:
+    """Sort by due date, tasks without one last."""
+    next_due = state.task.next_due
+    return (
+        next_due is None,
+        next_due.toordinal() if next_due is not None else 0,
+        state.task.id,
+    )
+
+
+def _priority_key(state: TaskState) -> tuple[Any, ...]:
+    """Sort by priority, most urgent first."""
+    return (
+        PRIORITY_ORDER.get(state.task.priority, len(PRIORITY_ORDER)),
+        state.task.id,
+    )
+
+
+# Every key ends with the task ID, so keys are unique and usable as cursors
+SORT_KEYS: dict[str, Callable[[TaskState], tuple[Any, ...]]] = {
+    "status": _status_key,
+    "next_due": _next_due_key,
+    "priority": _priority_key,
+    "name": lambda state: (state.task.name.casefold(), state.task.id),
+    "created_at": lambda state: (state.task.created_at, state.task.id),
+    "updated_at": lambda state: (state.task.updated_at, state.task.id),
+}
+
+
+def filter_tasks(
+    states: Iterable[TaskState],
+    categories: Collection[str] | None = None,
+    statuses: Collection[str] | None = None,
+    priorities: Collection[str] | None = None,
+    task_ids: Collection[str] | None = None,
+) -> list[TaskState]:
+    """Return the task states matching all given filters."""
+    result: list[TaskState] = []
+    for state in states:
+        task = state.task
+        if categories is not None and task.category not in categories:
+            continue
+        if statuses is not None and state.status not in statuses:
+            continue
+        if priorities is not None and task.priority not in priorities:
+            continue
+        if task_ids is not None and task.id not in task_ids:
+            continue
+        result.append(state)
+    return result
+
+
+def encode_cursor(key: tuple[Any, ...]) -> str:
+    """Return an opaque cursor for a sort key."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Any, ...]:
+    """Return the sort key of a cursor."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        raise InvalidCursor(cursor) from err
+    if not isinstance(key, list):
+        raise InvalidCursor(cursor)
+    return tuple(key)
+
+
+def page_tasks(
+    states: Iterable[TaskState],
+    sort: str = "status",
+    descending: bool = False,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> tuple[list[TaskState], str | None]:
+    """Sort task states and return one page plus the cursor of the next.
+
+    The cursor holds the sort key of the last returned task, so pages stay
+    consistent while tasks are added or removed between requests.
+    """
+    sort_key = SORT_KEYS[sort]
+    keyed = sorted((sort_key(state), state) for state in states)
+    keys = [key for key, _ in keyed]
+    if descending:
+        end = len(keyed)
+        if cursor is not None:
+            end = bisect_left(keys, _comparable(decode_cursor(cursor), keys))
+        start = 0 if limit is None else max(end - limit, 0)
+        page = keyed[start:end][::-1]
+        more = start > 0
+    else:
+        start = 0
+        if cursor is not None:
+            start = bisect_right(keys, _comparable(decode_cursor(cursor), keys))
+        end = len(keyed) if limit is None else start + limit
+        page = keyed[start:end]
+        more = end < len(keyed)
+    next_cursor = encode_cursor(page[-1][0]) if more and page else None
+    return [state for _, state in page], next_cursor
+
+
+def _comparable(key: tuple[Any, ...], keys: list[tuple[Any, ...]]) -> tuple[Any, ...]:
+    """Check that a decoded cursor has the shape of the sort keys."""
+    if keys and (
+        len(key) != len(keys[0])
+        or any(type(a) is not type(b) for a, b in zip(key, keys[0]))
+    ):
+        raise InvalidCursor(key)
+    return key
+
+
+def project_task(state: TaskState, fields: Collection[str] | None) -> dict[str, Any]:
+    """Return the JSON representation of a task limited to some fields."""
+    data = state.as_dict()
+    if fields is None:
+        return data
+    return {key: data[key] for key in TASK_FIELDS if key == "id" or key in fields}
@@ -0,0 +1,93 @@
+"""Interval arithmetic for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from dateutil.relativedelta import relativedelta
+
+from .const import IntervalUnit
+
+# Longest length of one interval unit in days, used to skip ahead
+_MAX_UNIT_DAYS = {
+    IntervalUnit.DAYS: 1,
+    IntervalUnit.WEEKS: 7,
+    IntervalUnit.MONTHS: 31,
+    IntervalUnit.YEARS: 366,
+}
+
+MAX_OCCURRENCES = 1000
+
+
+def interval_delta(interval_value: int, interval_unit: str) -> relativedelta | None:
+    """Return the length of an interval, or None for an unknown unit."""
+    if interval_unit == IntervalUnit.DAYS:
+        return relativedelta(days=interval_value)
+    if interval_unit == IntervalUnit.WEEKS:
+        return relativedelta(weeks=interval_value)
+    if interval_unit == IntervalUnit.MONTHS:
+        return relativedelta(months=interval_value)
+    if interval_unit == IntervalUnit.YEARS:
+        return relativedelta(years=interval_value)
+    return None
+
+
+def expand_occurrences(
+    first: date,
+    interval_value: int,
+    interval_unit: str,
+    start: date,
+    end: date,
+    limit: int = MAX_OCCURRENCES,
+) -> tuple[date, ...]:
+    """Return the occurrences of a recurring task in [start, end).
+
+    Occurrences are first + k * interval for k >= 0. Each one is computed
+    from the first date, so month ends do not drift (31 Jan, 28 Feb, 31 Mar).
+    """
+    if first >= end:
+        return ()
+    delta = interval_delta(interval_value, interval_unit)
+    if delta is None or interval_value < 1:
+        return (first,) if first >= start else ()
+
+    # Jump close to the window without overshooting it
+    k = 0
+    if first < start:
+        max_days = _MAX_UNIT_DAYS[interval_unit] * interval_value
+        k = (start - first).days // max_days
+        while first + delta * k < start:
+            k += 1
+
+    occurrences: list[date] = []
+    while len(occurrences) < limit:
+        occurrence = first + delta * k
+        if occurrence >= end:
+            break
+        occurrences.append(occurrence)
+        k += 1
+    return tuple(occurrences)
+
+
+def task_occurrences(
+    next_due: date,
+    interval_value: int,
+    interval_unit: str,
+    today: date,
+    start: date,
+    end: date,
+) -> tuple[date, ...]:
+    """Return the occurrences of a task in [start, end).
+
+    An overdue task is shown once on its due date. Later occurrences are
+    projected from today, as the task cannot be done before that.
+    """
+    if next_due >= today:
+        return expand_occurrences(next_due, interval_value, interval_unit, start, end)
+    overdue = (next_due,) if start <= next_due < end else ()
+    delta = interval_delta(interval_value, interval_unit)
+    if delta is None or interval_value < 1:
+        return overdue
+    return overdue + expand_occurrences(
+        today + delta, interval_value, interval_unit, start, end
+    )
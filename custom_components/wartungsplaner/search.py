@@ -0,0 +1,166 @@
+"""Full-text search index for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from slugify import slugify
+
+from .models import Task
+
+# Matches in the name rank above the manufacturer and the description
+FIELD_WEIGHTS = (("name", 3), ("manufacturer", 2), ("description", 1))
+# An exact token match counts more than a prefix match, which counts more
+# than a match inside a token (e.g. "filter" in "poolfilter")
+EXACT_MATCH_FACTOR = 4
+PREFIX_MATCH_FACTOR = 2
+INFIX_MATCH_FACTOR = 1
+# Length of the token fragments used to find matches inside tokens
+NGRAM_LENGTH = 3
+
+UMLAUT_REPLACEMENTS = [
+    ["Ä", "Ae"],
+    ["Ö", "Oe"],
+    ["Ü", "Ue"],
+    ["ä", "ae"],
+    ["ö", "oe"],
+    ["ü", "ue"],
+]
+
+
+def _ngrams(token: str) -> set[str]:
+    """Return the fragments of NGRAM_LENGTH characters of a token."""
+    return {
+        token[pos : pos + NGRAM_LENGTH]
+        for pos in range(len(token) - NGRAM_LENGTH + 1)
+    }
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the folded tokens of a text.
+
+    Umlauts are folded both ways, so "Öl" is found by "ol" and "oel".
+    """
+    tokens = slugify(text, separator=" ").split()
+    for token in slugify(
+        text, separator=" ", replacements=UMLAUT_REPLACEMENTS
+    ).split():
+        if token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+class SearchIndex:
+    """Map tokens of task names, manufacturers and descriptions to task IDs.
+
+    Matches inside tokens, common with German compound nouns, are found
+    through the n-grams of the vocabulary, so a query only touches the
+    tokens sharing its n-grams. Words shorter than an n-gram are compared
+    with every token.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Token -> task ID -> highest field weight of the token in the task
+        self._postings: dict[str, dict[str, int]] = {}
+        # N-gram -> tokens of the vocabulary containing it
+        self._ngrams: dict[str, set[str]] = {}
+        self._task_tokens: dict[str, dict[str, int]] = {}
+        self._task_texts: dict[str, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._task_tokens)
+
+    def update(self, task: Task) -> None:
+        """Index a task, skipping it if its texts did not change."""
+        texts = tuple(getattr(task, name) for name, _ in FIELD_WEIGHTS)
+        if self._task_texts.get(task.id) == texts:
+            return
+        self.discard(task.id)
+        tokens: dict[str, int] = {}
+        for text, (_, weight) in zip(texts, FIELD_WEIGHTS):
+            for token in tokenize(text):
+                if tokens.get(token, 0) < weight:
+                    tokens[token] = weight
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for ngram in _ngrams(token):
+                    self._ngrams.setdefault(ngram, set()).add(token)
+            postings[task.id] = weight
+        self._task_tokens[task.id] = tokens
+        self._task_texts[task.id] = texts
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task from the index."""
+        self._task_texts.pop(task_id, None)
+        for token in self._task_tokens.pop(task_id, {}):
+            postings = self._postings[token]
+            del postings[task_id]
+            if not postings:
+                del self._postings[token]
+                for ngram in _ngrams(token):
+                    tokens = self._ngrams[ngram]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self._ngrams[ngram]
+
+    def _candidates(self, word: str) -> Iterable[str]:
+        """Return tokens that may contain word, a superset of the matches."""
+        if len(word) < NGRAM_LENGTH:
+            return self._postings
+        candidates: set[str] | None = None
+        for ngram in sorted(_ngrams(word), key=lambda n: len(self._ngrams.get(n, ()))):
+            tokens = self._ngrams.get(ngram)
+            if not tokens:
+                return ()
+            candidates = set(tokens) if candidates is None else candidates & tokens
+            if not candidates:
+                return ()
+        return candidates or ()
+
+    def _match(self, word: str) -> dict[str, int]:
+        """Return the score of each task with a token containing word."""
+        scores: dict[str, int] = {}
+        for token in self._candidates(word):
+            if token == word:
+                factor = EXACT_MATCH_FACTOR
+            elif token.startswith(word):
+                factor = PREFIX_MATCH_FACTOR
+            elif word in token:
+                factor = INFIX_MATCH_FACTOR
+            else:
+                continue
+            for task_id, weight in self._postings[token].items():
+                score = weight * factor
+                if scores.get(task_id, 0) < score:
+                    scores[task_id] = score
+        return scores
+
+    def search(self, query: str) -> list[tuple[str, int]]:
+        """Return (task ID, score) of tasks matching every query token.
+
+        Every query token may match anywhere in a token. Exact matches score
+        highest, then prefix matches. Results are ordered by descending
+        score.
+        """
+        # The index holds both umlaut foldings, so the plain one suffices
+        words = slugify(query, separator=" ").split()
+        if not words:
+            return []
+        totals: dict[str, int] | None = None
+        # Rare tokens first keep the intersection small
+        for scores in sorted((self._match(word) for word in words), key=len):
+            if totals is None:
+                totals = scores
+            else:
+                totals = {
+                    task_id: total + scores[task_id]
+                    for task_id, total in totals.items()
+                    if task_id in scores
+                }
+            if not totals:
+                return []
+        return sorted(totals.items(), key=lambda item: (-item[1], item[0]))
@@ -5,18 +5,35 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CATEGORY_LABELS, DOMAIN, PRIORITY_LABELS, STATUS_LABELS
-from .coordinator import WartungsplanerCoordinator
+from .const import (
+    CATEGORY_ICONS,
+    CATEGORY_LABELS,
+    DOMAIN,
+    PRIORITY_LABELS,
+    STATUS_LABELS,
+    AttributeProfile,
+    TaskCategory,
+)
+from .coordinator import STATS_KEYS, WartungsplanerCoordinator
+from .entity import WartungsplanerTaskEntity, async_setup_task_entities
+from .models import format_date
 
 _LOGGER = logging.getLogger(__name__)
 
+STATS_ICONS = {
+    "overdue": "mdi:alert-circle",
+    "due": "mdi:alert",
+    "due_soon": "mdi:clock-alert",
+    "never_done": "mdi:help-circle",
+    "snoozed": "mdi:sleep",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,108 +41,95 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities from a config entry."""
+    async_setup_task_entities(
+        hass, entry, async_add_entities, "sensor", WartungsplanerTaskSensor
+    )
+
     coordinator: WartungsplanerCoordinator = hass.data[DOMAIN]["coordinator"]
+    async_add_entities(
+        WartungsplanerStatsSensor(coordinator, key) for key in STATS_KEYS
+    )
 
-    known_task_ids: set[str] = set()
+    known_categories: set[str] = set()
 
     @callback
-    def _async_add_new_sensors() -> None:
-        """Add sensors for newly discovered tasks."""
-        if coordinator.data is None:
+    def _async_add_category_sensors() -> None:
+        """Add count sensors for categories that are new or newly in use."""
+        categories = {str(category) for category in TaskCategory}
+        categories.update(coordinator.store.custom_categories)
+        if coordinator.data is not None:
+            categories.update(coordinator.data["category_stats"])
+        new_categories = categories - known_categories
+        if not new_categories:
             return
+        known_categories.update(new_categories)
+        async_add_entities(
+            WartungsplanerCategorySensor(coordinator, category)
+            for category in sorted(new_categories)
+        )
 
-        tasks = coordinator.data.get("tasks", {})
-        new_entities = []
-
-        for task_id in tasks:
-            if task_id not in known_task_ids:
-                known_task_ids.add(task_id)
-                new_entities.append(
-                    WartungsplanerTaskSensor(coordinator, task_id)
-                )
-
-        # Remove entities for deleted tasks
-        current_ids = set(tasks.keys())
-        removed_ids = known_task_ids - current_ids
-        if removed_ids:
-            ent_reg = er.async_get(hass)
-            for task_id in removed_ids:
-                entity_id = ent_reg.async_get_entity_id(
-                    "sensor", DOMAIN, f"wartungsplaner_task_{task_id}"
-                )
-                if entity_id:
-                    ent_reg.async_remove(entity_id)
-        known_task_ids.intersection_update(current_ids)
-
-        if new_entities:
-            async_add_entities(new_entities)
-
-    # Add existing tasks
-    _async_add_new_sensors()
-
-    # Listen for future updates to add new tasks dynamically
+    _async_add_category_sensors()
     entry.async_on_unload(
-        coordinator.async_add_listener(_async_add_new_sensors)
+        coordinator.async_add_listener(_async_add_category_sensors)
     )
 
 
-class WartungsplanerTaskSensor(
-    CoordinatorEntity[WartungsplanerCoordinator], SensorEntity
-):
+class WartungsplanerTaskSensor(WartungsplanerTaskEntity, SensorEntity):
     """Sensor entity for a maintenance task (days until due)."""
 
-    _attr_has_entity_name = True
+    unique_id_prefix = "wartungsplaner_task_"
     _attr_native_unit_of_measurement = "days"
     _attr_icon = "mdi:wrench-clock"
-
-    def __init__(
-        self,
-        coordinator: WartungsplanerCoordinator,
-        task_id: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._task_id = task_id
-        self._attr_unique_id = f"wartungsplaner_task_{task_id}"
-
-    @property
-    def _task_data(self) -> dict[str, Any] | None:
-        """Get the current task data from coordinator."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get("tasks", {}).get(self._task_id)
-
-    @property
-    def available(self) -> bool:
-        """Return True if the task still exists."""
-        return self._task_data is not None
+    # Static or large attributes are kept on the state but not recorded
+    _unrecorded_attributes = frozenset(
+        {
+            "task_id",
+            "status_label",
+            "category",
+            "category_label",
+            "priority",
+            "priority_label",
+            "last_completed",
+            "interval_value",
+            "interval_unit",
+            "description",
+        }
+    )
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        task = self._task_data
-        if task:
-            return task["name"]
+        state = self._task_data
+        if state:
+            return state.task.name
         return f"Task {self._task_id[:8]}"
 
     @property
     def native_value(self) -> int | None:
         """Return the number of days until the task is due."""
-        task = self._task_data
-        if task is None:
+        state = self._task_data
+        if state is None:
             return None
-        return task.get("days_until_due")
+        return state.days_until_due
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        task = self._task_data
-        if task is None:
+        state = self._task_data
+        if state is None:
             return {}
 
-        status = task.get("status", "unknown")
-        category = task.get("category", "other")
-        priority = task.get("priority", "medium")
+        task = state.task
+        status = state.status
+        if self.coordinator.store.attribute_profile == AttributeProfile.LEAN:
+            return {
+                "task_id": self._task_id,
+                "status": status,
+                "next_due": format_date(task.next_due),
+            }
+
+        category = task.category
+        priority = task.priority
 
         return {
             "task_id": self._task_id,
@@ -135,22 +139,22 @@ class WartungsplanerTaskSensor(
             "category_label": CATEGORY_LABELS.get(category, {}).get("de", category),
             "priority": priority,
             "priority_label": PRIORITY_LABELS.get(priority, {}).get("de", priority),
-            "next_due": task.get("next_due"),
-            "last_completed": task.get("last_completed"),
-            "interval_value": task.get("interval_value"),
-            "interval_unit": task.get("interval_unit"),
-            "description": task.get("description", ""),
-            "snoozed_until": task.get("snoozed_until"),
+            "next_due": format_date(task.next_due),
+            "last_completed": format_date(task.last_completed),
+            "interval_value": task.interval_value,
+            "interval_unit": task.interval_unit,
+            "description": task.description,
+            "snoozed_until": format_date(task.snoozed_until),
         }
 
     @property
     def icon(self) -> str:
         """Return the icon based on task status."""
-        task = self._task_data
-        if task is None:
+        state = self._task_data
+        if state is None:
             return "mdi:wrench-clock"
 
-        status = task.get("status")
+        status = state.status
         if status == "overdue":
             return "mdi:alert-circle"
         if status == "due":
@@ -160,3 +164,116 @@ class WartungsplanerTaskSensor(
         if status == "never_done":
             return "mdi:help-circle"
         return "mdi:check-circle"
+
+
+class WartungsplanerCountSensor(
+    CoordinatorEntity[WartungsplanerCoordinator], SensorEntity
+):
+    """Base class for sensors counting tasks.
+
+    Counts come from the stats the coordinator keeps up to date with every
+    task change, so reading them never walks the task list. The state is
+    only written when it changed.
+    """
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: WartungsplanerCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._written: tuple[Any, ...] | None = None
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return everything that ends up in the written state."""
+        return (
+            self.name,
+            self.icon,
+            self.native_value,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if it changed."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._written:
+            return
+        self._written = snapshot
+        super()._handle_coordinator_update()
+
+
+class WartungsplanerStatsSensor(WartungsplanerCountSensor):
+    """Sensor for the number of all tasks, or of all tasks with a status."""
+
+    def __init__(self, coordinator: WartungsplanerCoordinator, key: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_unique_id = f"wartungsplaner_stats_{key}"
+        if key == "total":
+            self._attr_name = "Aufgaben gesamt"
+            self._attr_icon = "mdi:format-list-checks"
+        else:
+            self._attr_name = f"Aufgaben {STATUS_LABELS[key]['de']}"
+            self._attr_icon = STATS_ICONS.get(key, "mdi:check-circle")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of tasks."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data["stats"].get(self._key)
+
+
+class WartungsplanerCategorySensor(WartungsplanerCountSensor):
+    """Sensor for the number of due or overdue tasks in a category."""
+
+    _unrecorded_attributes = frozenset({"category"})
+
+    def __init__(
+        self, coordinator: WartungsplanerCoordinator, category: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._category = category
+        self._attr_unique_id = f"wartungsplaner_category_{category}"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        custom = self.coordinator.store.custom_categories.get(self._category)
+        if custom is not None:
+            label = custom["name_de"]
+        else:
+            label = CATEGORY_LABELS.get(self._category, {}).get("de", self._category)
+        return f"Kategorie {label}"
+
+    @property
+    def icon(self) -> str:
+        """Return the category icon."""
+        custom = self.coordinator.store.custom_categories.get(self._category)
+        if custom is not None:
+            return custom.get("icon", "mdi:dots-horizontal")
+        return CATEGORY_ICONS.get(self._category, "mdi:dots-horizontal")
+
+    def _counts(self) -> dict[str, int]:
+        """Return the stats of this category."""
+        if self.coordinator.data is None:
+            return {}
+        return self.coordinator.data["category_stats"].get(
+            self._category, dict.fromkeys(STATS_KEYS, 0)
+        )
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the number of due and overdue tasks."""
+        counts = self._counts()
+        if not counts:
+            return None
+        return counts["due"] + counts["overdue"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the task counts per status."""
+        return {"category": self._category, **self._counts()}
@@ -0,0 +1,163 @@
+"""Columnar status computation for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+
+from .const import TaskStatus
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
+
+# Ordinal used for missing dates; real dates start at ordinal 1
+NO_DATE = 0
+
+STATUS_CODES: tuple[TaskStatus, ...] = (
+    TaskStatus.OVERDUE,
+    TaskStatus.DUE,
+    TaskStatus.DUE_SOON,
+    TaskStatus.DONE,
+    TaskStatus.NEVER_DONE,
+    TaskStatus.SNOOZED,
+)
+_OVERDUE, _DUE, _DUE_SOON, _DONE, _NEVER_DONE, _SNOOZED = range(len(STATUS_CODES))
+
+
+def _ordinal(value: date | None) -> int:
+    """Return the day ordinal of a date, or NO_DATE."""
+    return value.toordinal() if value is not None else NO_DATE
+
+
+class StatusColumns:
+    """Keep next_due and snoozed_until of all tasks as day ordinal columns.
+
+    Statuses, days until due and status counts for all tasks are computed
+    in one pass over the columns, vectorized with NumPy if it is installed
+    and with a plain loop otherwise. Both produce the same results as
+    WartungsplanerCoordinator._compute_task_status.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self._task_ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._next_due = array("i")
+        self._snoozed_until = array("i")
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return len(self._task_ids)
+
+    @property
+    def backend(self) -> str:
+        """Return the name of the backend used by compute."""
+        return "numpy" if np is not None else "python"
+
+    @property
+    def task_ids(self) -> list[str]:
+        """Return task IDs in column order."""
+        return self._task_ids
+
+    def set(
+        self, task_id: str, next_due: date | None, snoozed_until: date | None
+    ) -> None:
+        """Insert or update the dates of a task."""
+        pos = self._positions.get(task_id)
+        if pos is None:
+            self._positions[task_id] = len(self._task_ids)
+            self._task_ids.append(task_id)
+            self._next_due.append(_ordinal(next_due))
+            self._snoozed_until.append(_ordinal(snoozed_until))
+            return
+        self._next_due[pos] = _ordinal(next_due)
+        self._snoozed_until[pos] = _ordinal(snoozed_until)
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task by moving the last row into its place."""
+        pos = self._positions.pop(task_id, None)
+        if pos is None:
+            return
+        last_id = self._task_ids.pop()
+        next_due = self._next_due.pop()
+        snoozed_until = self._snoozed_until.pop()
+        if last_id == task_id:
+            return
+        self._task_ids[pos] = last_id
+        self._next_due[pos] = next_due
+        self._snoozed_until[pos] = snoozed_until
+        self._positions[last_id] = pos
+
+    def compute(
+        self, today: date, due_soon_days: int
+    ) -> tuple[list[TaskStatus], list[int | None], dict[str, int]]:
+        """Return statuses and days until due in column order, and counts."""
+        if not self._task_ids:
+            return [], [], {status.value: 0 for status in STATUS_CODES}
+        if np is not None:
+            codes, days, counts = self._compute_numpy(
+                today.toordinal(), due_soon_days
+            )
+        else:
+            codes, days, counts = self._compute_python(
+                today.toordinal(), due_soon_days
+            )
+        return (
+            [STATUS_CODES[code] for code in codes],
+            days,
+            {status.value: count for status, count in zip(STATUS_CODES, counts)},
+        )
+
+    def _compute_numpy(
+        self, today: int, due_soon_days: int
+    ) -> tuple[list[int], list[int | None], list[int]]:
+        """Compute status codes, days and counts with NumPy."""
+        next_due = np.frombuffer(self._next_due, dtype=np.intc)
+        snoozed_until = np.frombuffer(self._snoozed_until, dtype=np.intc)
+
+        # Later assignments take precedence, mirroring the branch order of
+        # the scalar computation from the bottom up
+        codes = np.full(len(next_due), _DONE, dtype=np.int8)
+        codes[next_due <= today + due_soon_days] = _DUE_SOON
+        codes[next_due == today] = _DUE
+        codes[next_due < today] = _OVERDUE
+        never_done = next_due == NO_DATE
+        codes[never_done] = _NEVER_DONE
+        codes[snoozed_until > today] = _SNOOZED
+
+        days: list[int | None] = (next_due - today).tolist()
+        for pos in np.flatnonzero(never_done).tolist():
+            days[pos] = None
+        counts = np.bincount(codes, minlength=len(STATUS_CODES)).tolist()
+        return codes.tolist(), days, counts
+
+    def _compute_python(
+        self, today: int, due_soon_days: int
+    ) -> tuple[list[int], list[int | None], list[int]]:
+        """Compute status codes, days and counts with a plain loop."""
+        due_soon = today + due_soon_days
+        codes: list[int] = []
+        days: list[int | None] = []
+        for next_due, snoozed_until in zip(self._next_due, self._snoozed_until):
+            if next_due == NO_DATE:
+                days.append(None)
+            else:
+                days.append(next_due - today)
+            if snoozed_until > today:
+                codes.append(_SNOOZED)
+            elif next_due == NO_DATE:
+                codes.append(_NEVER_DONE)
+            elif next_due < today:
+                codes.append(_OVERDUE)
+            elif next_due == today:
+                codes.append(_DUE)
+            elif next_due <= due_soon:
+                codes.append(_DUE_SOON)
+            else:
+                codes.append(_DONE)
+        counts = [0] * len(STATUS_CODES)
+        for code in codes:
+            counts[code] += 1
+        return codes, days, counts
@@ -2,53 +2,158 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
+import time
 import uuid
-from datetime import date, datetime
+from collections.abc import Callable, Set
+from dataclasses import replace
+from datetime import date
 from typing import Any
 
-from dateutil.relativedelta import relativedelta
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from slugify import slugify
 
-from .const import DEFAULT_DUE_SOON_DAYS, DOMAIN, STORAGE_KEY, STORAGE_VERSION, IntervalUnit
+from .const import (
+    DEFAULT_ATTRIBUTE_PROFILE,
+    DEFAULT_DUE_SOON_DAYS,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_SAVE_DELAY,
+    DOMAIN,
+    HISTORY_STORAGE_KEY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    TaskCategory,
+)
+from .models import Task, parse_date
+from .recurrence import interval_delta
+from .search import SearchIndex
+from .task_index import TaskIndex
+from .templates import get_templates
 
 _LOGGER = logging.getLogger(__name__)
 
+BULK_DATE_FIELDS = ("last_completed", "until_date")
+UPDATE_FIELDS = (
+    "name",
+    "description",
+    "manufacturer",
+    "category",
+    "priority",
+    "interval_value",
+    "interval_unit",
+    "last_completed",
+)
+
+# Snapshots taking longer than this on the event loop are logged
+SLOW_SNAPSHOT_MS = 50
+
+# Newer Home Assistant versions can encode store data in the executor
+_STORE_KWARGS: dict[str, Any] = (
+    {"serialize_in_event_loop": False}
+    if "serialize_in_event_loop" in inspect.signature(Store.__init__).parameters
+    else {}
+)
+
+
+def _shard_name(category: str) -> str:
+    """Return the storage shard holding tasks of a category."""
+    return slugify(str(category), separator="_") or "other"
+
 
 def _calculate_next_due(
-    last_completed: str | None,
+    last_completed: date | None,
     interval_value: int,
     interval_unit: str,
-    snoozed_until: str | None = None,
-) -> str | None:
+    snoozed_until: date | None = None,
+) -> date | None:
     """Calculate the next due date based on last completion and interval."""
     next_due = None
 
     if last_completed is not None:
-        base_date = date.fromisoformat(last_completed)
-
-        if interval_unit == IntervalUnit.DAYS:
-            next_due = base_date + relativedelta(days=interval_value)
-        elif interval_unit == IntervalUnit.WEEKS:
-            next_due = base_date + relativedelta(weeks=interval_value)
-        elif interval_unit == IntervalUnit.MONTHS:
-            next_due = base_date + relativedelta(months=interval_value)
-        elif interval_unit == IntervalUnit.YEARS:
-            next_due = base_date + relativedelta(years=interval_value)
+        delta = interval_delta(interval_value, interval_unit)
+        if delta is not None:
+            next_due = last_completed + delta
 
     # If snoozed, use snooze date if it's later (or if next_due is None)
-    if snoozed_until:
-        snooze_date = date.fromisoformat(snoozed_until)
-        if next_due is None or snooze_date > next_due:
-            next_due = snooze_date
-
-    if next_due is None:
-        return None
-
-    return next_due.isoformat()
+    if snoozed_until is not None:
+        if next_due is None or snoozed_until > next_due:
+            next_due = snoozed_until
+
+    return next_due
+
+
+def _returning(snapshot: dict[str, Any]) -> Callable[[], dict[str, Any]]:
+    """Return a data function for Store.async_delay_save."""
+    return lambda: snapshot
+
+
+def _shard_data(tasks: tuple[Task, ...]) -> Callable[[], dict[str, Any]]:
+    """Return a data function building the stored tasks of a shard."""
+    return lambda: {"tasks": {task.id: task.as_dict() for task in tasks}}
+
+
+def _copy_history(history: dict[str, Any] | None) -> dict[str, Any]:
+    """Return a copy of a task history that can be changed independently."""
+    if history is None:
+        return {"entries": [], "summaries": {}}
+    return {
+        "entries": list(history["entries"]),
+        "summaries": {
+            year: dict(summary) for year, summary in history["summaries"].items()
+        },
+    }
+
+
+def _merge_inline_history(
+    inline: list[dict[str, Any]],
+    history: dict[str, Any] | None,
+    retention: int,
+) -> dict[str, Any]:
+    """Return a task history holding the inline entries of an older version.
+
+    An interrupted migration is repeated, so entries moved before are
+    recognized by date and timestamp instead of being added again. The
+    summaries are rebuilt from all entries.
+    """
+    entries = {
+        (entry["date"], entry.get("timestamp", "")): entry
+        for entry in (*(history["entries"] if history else ()), *inline)
+    }
+    merged = {
+        "entries": [entries[key] for key in sorted(entries)],
+        "summaries": {},
+    }
+    _compact_history(merged, retention)
+    return merged
+
+
+def _compact_history(history: dict[str, Any], retention: int) -> None:
+    """Roll entries beyond the retention limit into per-year summaries."""
+    entries = history["entries"]
+    overflow = len(entries) - retention
+    if overflow <= 0:
+        return
+
+    summaries = history["summaries"]
+    for entry in entries[:overflow]:
+        year = entry["date"][:4]
+        summary = summaries.get(year)
+        if summary is None:
+            summaries[year] = {
+                "count": 1,
+                "first": entry["date"],
+                "last": entry["date"],
+            }
+            continue
+        summary["count"] += 1
+        summary["first"] = min(summary["first"], entry["date"])
+        summary["last"] = max(summary["last"], entry["date"])
+    del entries[:overflow]
 
 
 class WartungsplanerStore:
@@ -57,15 +162,43 @@ class WartungsplanerStore:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the store."""
         self._hass = hass
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-        self._tasks: dict[str, dict[str, Any]] = {}
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY, **_STORE_KWARGS)
+        self._history_store = Store(
+            hass, STORAGE_VERSION, HISTORY_STORAGE_KEY, **_STORE_KWARGS
+        )
+        self._tasks: dict[str, Task] = {}
         self._custom_templates: dict[str, dict[str, Any]] = {}
         self._custom_categories: dict[str, dict[str, Any]] = {}
         self._hidden_templates: set[str] = set()
         self._settings: dict[str, Any] = {"due_soon_days": DEFAULT_DUE_SOON_DAYS}
+        self._history: dict[str, dict[str, Any]] = {}
+        # Random epoch keeps versions from matching across restarts
+        self._templates_epoch = uuid.uuid4().hex[:8]
+        self._templates_revision = 0
+        self._templates_payload: dict[str, Any] | None = None
+        self._changed_task_ids: set[str] = set()
+        # Tasks are stored in one file per category shard
+        self._shards: dict[str, Store] = {}
+        self._shard_members: dict[str, set[str]] = {}
+        self._task_shards: dict[str, str] = {}
+        self._pending_shards: set[str] = set()
+        self._search_index = SearchIndex()
+        self._category_index = TaskIndex()
+        self._priority_index = TaskIndex()
+        self._save_pending = False
+        self._history_save_pending = False
+        self._snapshot_handle: asyncio.Handle | None = None
+        self._unflushed: dict[str, tuple[Store, Callable[[], dict[str, Any]]]] = {}
+        self._save_stats: dict[str, float] = {
+            "scheduled": 0,
+            "written": 0,
+            "snapshots": 0,
+            "loop_ms_total": 0.0,
+            "loop_ms_max": 0.0,
+        }
 
     @property
-    def tasks(self) -> dict[str, dict[str, Any]]:
+    def tasks(self) -> dict[str, Task]:
         """Return all tasks."""
         return self._tasks
 
@@ -84,103 +217,458 @@ class WartungsplanerStore:
         """Return IDs of hidden builtin templates."""
         return self._hidden_templates
 
+    @property
+    def templates_version(self) -> str:
+        """Return a version string that changes with the template list."""
+        return f"{self._templates_epoch}.{self._templates_revision}"
+
+    def get_templates_payload(self) -> dict[str, Any]:
+        """Return visible builtin plus custom templates, cached until changed."""
+        if self._templates_payload is None:
+            builtin = [
+                t for t in get_templates() if t["id"] not in self._hidden_templates
+            ]
+            self._templates_payload = {
+                "templates": builtin + list(self._custom_templates.values()),
+                "hidden_count": len(self._hidden_templates),
+                "version": self.templates_version,
+            }
+        return self._templates_payload
+
+    @callback
+    def _async_invalidate_templates(self) -> None:
+        """Drop the cached template list after custom or hidden changes."""
+        self._templates_revision += 1
+        self._templates_payload = None
+
     @property
     def settings(self) -> dict[str, Any]:
         """Return settings."""
         return self._settings
 
+    @property
+    def has_changed_tasks(self) -> bool:
+        """Return True if tasks changed since the last pop."""
+        return bool(self._changed_task_ids)
+
+    @callback
+    def async_pop_changed_task_ids(self) -> set[str]:
+        """Return and reset the IDs of tasks added, changed or deleted."""
+        changed = self._changed_task_ids
+        self._changed_task_ids = set()
+        return changed
+
+    def task_ids_by_category(self, category: str) -> Set[str]:
+        """Return the IDs of tasks in a category."""
+        return self._category_index.get(category)
+
+    def task_ids_by_priority(self, priority: str) -> Set[str]:
+        """Return the IDs of tasks with a priority."""
+        return self._priority_index.get(priority)
+
+    @property
+    def category_counts(self) -> dict[str, int]:
+        """Return the number of tasks per category."""
+        return self._category_index.counts()
+
+    @property
+    def save_delay(self) -> float:
+        """Return the write-behind window in seconds (0 = next loop iteration)."""
+        return self._settings.get("save_delay", DEFAULT_SAVE_DELAY)
+
+    @property
+    def history_retention(self) -> int:
+        """Return how many completions are kept in full detail per task."""
+        return self._settings.get("history_retention", DEFAULT_HISTORY_RETENTION)
+
+    @property
+    def attribute_profile(self) -> str:
+        """Return the attribute profile of task entities (full or lean)."""
+        return self._settings.get("attribute_profile", DEFAULT_ATTRIBUTE_PROFILE)
+
+    @property
+    def save_stats(self) -> dict[str, float]:
+        """Return save counters and the event loop time spent on snapshots.
+
+        A scheduled save is coalesced when it is merged into the write of
+        another save of the same file. Each file still waiting for its write
+        has one scheduled save that is not coalesced.
+        """
+        stats = {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in self._save_stats.items()
+        }
+        stats["coalesced"] = max(
+            stats["scheduled"] - stats["written"] - len(self._pending_keys()), 0
+        )
+        return stats
+
+    @property
+    def shard_count(self) -> int:
+        """Return the number of task storage shards."""
+        return len(self._shards)
+
+    def _shard_store(self, name: str) -> Store:
+        """Return the Store of a task shard, creating it if needed."""
+        store = self._shards.get(name)
+        if store is None:
+            store = self._shards[name] = Store(
+                self._hass, STORAGE_VERSION, f"{STORAGE_KEY}.{name}", **_STORE_KWARGS
+            )
+        return store
+
     async def async_load(self) -> None:
         """Load data from storage."""
-        data = await self._store.async_load()
-        if data and "tasks" in data:
-            self._tasks = data["tasks"]
-        else:
-            self._tasks = {}
-        self._custom_templates = (data or {}).get("custom_templates", {})
-        self._custom_categories = (data or {}).get("custom_categories", {})
-        self._hidden_templates = set((data or {}).get("hidden_templates", []))
-        self._settings = (data or {}).get("settings", {"due_soon_days": DEFAULT_DUE_SOON_DAYS})
-        _LOGGER.debug("Loaded %d tasks from storage", len(self._tasks))
+        data = await self._store.async_load() or {}
+        self._custom_templates = data.get("custom_templates", {})
+        self._custom_categories = data.get("custom_categories", {})
+        self._hidden_templates = set(data.get("hidden_templates", []))
+        self._settings = data.get("settings", {"due_soon_days": DEFAULT_DUE_SOON_DAYS})
+
+        # The main file and a new shard are saved independently, so a shard
+        # written before the main file listed it is found by its category.
+        # Shards are independent files, so they are loaded concurrently.
+        listed: list[str] = data.get("shards", [])
+        shard_names = sorted(
+            {
+                *listed,
+                *(_shard_name(category) for category in TaskCategory),
+                *(_shard_name(category) for category in self._custom_categories),
+            }
+        )
+        shard_data = await asyncio.gather(
+            *(self._shard_store(name).async_load() for name in shard_names)
+        )
+        stored_tasks: dict[str, dict[str, Any]] = {}
+        for name, shard in zip(shard_names, shard_data):
+            if shard is None and name not in listed:
+                del self._shards[name]
+                continue
+            stored_tasks.update((shard or {}).get("tasks", {}))
+
+        # Older versions kept all tasks in the main file
+        legacy_tasks: dict[str, dict[str, Any]] = data.get("tasks", {})
+        stored_tasks.update(legacy_tasks)
+
+        history_data = await self._history_store.async_load()
+        self._history = (history_data or {}).get("tasks", {})
+
+        # Move inline completion histories from older versions to the
+        # separate history storage
+        migrated = 0
+        for task_id, task in stored_tasks.items():
+            if "completion_history" not in task:
+                continue
+            entries = task.pop("completion_history")
+            self._history[task_id] = _merge_inline_history(
+                entries, self._history.get(task_id), self.history_retention
+            )
+            task["completion_count"] = len(entries)
+            migrated += 1
+        if migrated:
+            _LOGGER.info("Moved completion history of %d tasks to separate storage", migrated)
+            self.async_schedule_history_save()
+
+        self._tasks = {
+            task_id: Task.from_dict(task) for task_id, task in stored_tasks.items()
+        }
+        for task_id, task in self._tasks.items():
+            name = _shard_name(task.category)
+            self._shard_store(name)
+            self._shard_members.setdefault(name, set()).add(task_id)
+            self._task_shards[task_id] = name
+            self._search_index.update(task)
+            self._category_index.set(task_id, task.category)
+            self._priority_index.set(task_id, task.priority)
+        _LOGGER.debug(
+            "Loaded %d tasks from %d storage shards", len(self._tasks), len(self._shards)
+        )
+        if not set(self._shards).issubset(listed):
+            # List the found shards in the main file
+            self.async_schedule_save()
+
+        if legacy_tasks or migrated:
+            # History and shards are written before the main file drops its
+            # tasks, so an interrupted migration is repeated on the next start
+            _LOGGER.info("Migrating %d tasks to sharded storage", len(legacy_tasks))
+            await self.async_save()
+
+    def _edit_task(self, task_id: str) -> Task:
+        """Return a copy of a task to change in place of the stored one.
+
+        Tasks are copy-on-write, so snapshots taken for a save keep seeing
+        the tasks as they were.
+        """
+        task = self._tasks[task_id] = replace(self._tasks[task_id])
+        return task
+
+    def _meta_snapshot(self) -> Callable[[], dict[str, Any]]:
+        """Return a data function for a snapshot of the main file."""
+        return _returning(
+            {
+                "shards": sorted(self._shards),
+                "custom_templates": dict(self._custom_templates),
+                "custom_categories": dict(self._custom_categories),
+                "hidden_templates": list(self._hidden_templates),
+                "settings": dict(self._settings),
+            }
+        )
+
+    def _shard_snapshot(self, name: str) -> Callable[[], dict[str, Any]]:
+        """Return a data function for a snapshot of the tasks in a shard."""
+        return _shard_data(
+            tuple(self._tasks[task_id] for task_id in self._shard_members.get(name, ()))
+        )
+
+    def _history_snapshot(self) -> Callable[[], dict[str, Any]]:
+        """Return a data function for a snapshot of the completion history."""
+        return _returning({"tasks": dict(self._history)})
+
+    def _pending_keys(self) -> set[str]:
+        """Return the keys of all files with changes that are not written yet."""
+        keys = set(self._unflushed)
+        keys.update(self._shards[name].key for name in self._pending_shards)
+        if self._save_pending:
+            keys.add(self._store.key)
+        if self._history_save_pending:
+            keys.add(self._history_store.key)
+        return keys
+
+    def _dirty_snapshots(self) -> list[tuple[Store, Callable[[], dict[str, Any]]]]:
+        """Take snapshots of all files with unsaved changes and reset them.
+
+        Snapshots only hold references to tasks and histories that are
+        replaced instead of modified, so they are cheap to take on the event
+        loop. The stored data is built from them by the returned data
+        functions, in the executor where supported.
+        """
+        started = time.perf_counter()
+        snapshots = [
+            (self._shards[name], self._shard_snapshot(name))
+            for name in self._pending_shards
+        ]
+        if self._history_save_pending:
+            snapshots.insert(0, (self._history_store, self._history_snapshot()))
+        # The main file comes last, as it drops the inline tasks and
+        # histories of older versions
+        if self._save_pending:
+            snapshots.append((self._store, self._meta_snapshot()))
+        self._pending_shards.clear()
+        self._save_pending = False
+        self._history_save_pending = False
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self._save_stats["snapshots"] += len(snapshots)
+        self._save_stats["loop_ms_total"] += elapsed
+        self._save_stats["loop_ms_max"] = max(self._save_stats["loop_ms_max"], elapsed)
+        if elapsed > SLOW_SNAPSHOT_MS:
+            _LOGGER.warning(
+                "Taking %d storage snapshots blocked the event loop for %.1f ms",
+                len(snapshots),
+                elapsed,
+            )
+        return snapshots
 
     async def async_save(self) -> None:
-        """Save data to storage."""
-        await self._store.async_save({
-            "tasks": self._tasks,
-            "custom_templates": self._custom_templates,
-            "custom_categories": self._custom_categories,
-            "hidden_templates": list(self._hidden_templates),
-            "settings": self._settings,
-        })
-
-    async def async_add_task(self, task_data: dict[str, Any]) -> dict[str, Any]:
+        """Save the main file and all shards to storage immediately.
+
+        Files are written one after another, the main file last.
+        """
+        pending = self._pending_keys()
+        self._pending_shards.update(self._shards)
+        self._save_pending = True
+        for store, data_func in self._dirty_snapshots():
+            if store.key not in pending:
+                self._save_stats["scheduled"] += 1
+            # Replaces any delayed save of the same file
+            self._unflushed.pop(store.key, None)
+            await store.async_save(data_func())
+            self._save_stats["written"] += 1
+
+    @callback
+    def _async_request_snapshots(self) -> None:
+        """Hand snapshots to the delayed saves once the current burst is done."""
+        if self._snapshot_handle is None:
+            self._snapshot_handle = self._hass.loop.call_soon(
+                self._async_hand_off_snapshots
+            )
+
+    @callback
+    def _async_hand_off_snapshots(self) -> None:
+        """Pass snapshots of all changed files to their delayed saves."""
+        self._snapshot_handle = None
+        for store, data_func in self._dirty_snapshots():
+            # Kept for async_flush until the delayed save has run
+            self._unflushed[store.key] = (store, data_func)
+            store.async_delay_save(
+                self._recording_write(store.key, data_func), self.save_delay
+            )
+
+    def _recording_write(
+        self, key: str, data_func: Callable[[], dict[str, Any]]
+    ) -> Callable[[], dict[str, Any]]:
+        """Return a data function that records when its delayed save runs.
+
+        Store calls it only for the write that actually happens, which may be
+        in the executor, so the result is recorded on the event loop.
+        """
+
+        def write() -> dict[str, Any]:
+            data = data_func()
+            self._hass.loop.call_soon_threadsafe(
+                self._async_delayed_save_written, key, data_func
+            )
+            return data
+
+        return write
+
+    @callback
+    def _async_delayed_save_written(
+        self, key: str, data_func: Callable[[], dict[str, Any]]
+    ) -> None:
+        """Count a delayed write and forget its snapshot."""
+        self._save_stats["written"] += 1
+        # A newer snapshot of the file may already wait for the next write
+        unflushed = self._unflushed.get(key)
+        if unflushed is not None and unflushed[1] is data_func:
+            del self._unflushed[key]
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed save, merging bursts of mutations into one write."""
+        self._save_stats["scheduled"] += 1
+        self._save_pending = True
+        self._async_request_snapshots()
+
+    @callback
+    def _async_schedule_shard_save(self, name: str) -> None:
+        """Schedule a delayed save of one shard."""
+        self._shard_store(name)
+        self._save_stats["scheduled"] += 1
+        self._pending_shards.add(name)
+        self._async_request_snapshots()
+
+    @callback
+    def _async_task_changed(self, task_id: str) -> None:
+        """Record a task change and schedule saving the shards it touches.
+
+        A task whose category changed moves to another shard, so both the
+        old and the new shard are rewritten.
+        """
+        self._changed_task_ids.add(task_id)
+        task = self._tasks.get(task_id)
+        if task is not None:
+            self._search_index.update(task)
+            self._category_index.set(task_id, task.category)
+            self._priority_index.set(task_id, task.priority)
+        else:
+            self._search_index.discard(task_id)
+            self._category_index.discard(task_id)
+            self._priority_index.discard(task_id)
+        old = self._task_shards.get(task_id)
+        new = _shard_name(task.category) if task is not None else None
+        if old != new:
+            if old is not None:
+                self._shard_members[old].discard(task_id)
+                del self._task_shards[task_id]
+                self._async_schedule_shard_save(old)
+            if new is not None:
+                if new not in self._shards:
+                    # The main file lists the shards to load
+                    self.async_schedule_save()
+                self._shard_members.setdefault(new, set()).add(task_id)
+                self._task_shards[task_id] = new
+        if new is not None:
+            self._async_schedule_shard_save(new)
+
+    @callback
+    def async_schedule_history_save(self) -> None:
+        """Schedule a delayed save of the completion history."""
+        self._save_stats["scheduled"] += 1
+        self._history_save_pending = True
+        self._async_request_snapshots()
+
+    async def async_flush(self) -> None:
+        """Write pending delayed saves right away."""
+        if self._snapshot_handle is not None:
+            self._snapshot_handle.cancel()
+            self._snapshot_handle = None
+        for store, data_func in self._dirty_snapshots():
+            self._unflushed[store.key] = (store, data_func)
+        if not self._unflushed:
+            return
+        # Replaces the delayed saves, so their data functions are not called
+        for store, data_func in self._unflushed.values():
+            await store.async_save(data_func())
+            self._save_stats["written"] += 1
+        self._unflushed.clear()
+        stats = self.save_stats
+        _LOGGER.debug(
+            "Flushed pending saves (%d of %d saves coalesced)",
+            stats["coalesced"],
+            stats["scheduled"],
+        )
+
+    async def async_add_task(self, task_data: dict[str, Any]) -> Task:
         """Add a new task."""
         task_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
-
-        task = {
-            "id": task_id,
-            "name": task_data["name"],
-            "description": task_data.get("description", ""),
-            "manufacturer": task_data.get("manufacturer", ""),
-            "category": task_data.get("category", "other"),
-            "priority": task_data.get("priority", "medium"),
-            "interval_value": task_data.get("interval_value", 1),
-            "interval_unit": task_data.get("interval_unit", "months"),
-            "last_completed": task_data.get("last_completed"),
-            "completion_history": [],
-            "next_due": None,
-            "snoozed_until": None,
-            "created_at": now,
-            "updated_at": now,
-        }
+        now = dt_util.now().isoformat()
+
+        task = Task.from_dict(
+            {
+                **task_data,
+                "id": task_id,
+                "completion_count": 0,
+                "next_due": None,
+                "snoozed_until": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
 
         # Calculate next_due
-        task["next_due"] = _calculate_next_due(
-            task["last_completed"],
-            task["interval_value"],
-            task["interval_unit"],
+        task.next_due = _calculate_next_due(
+            task.last_completed,
+            task.interval_value,
+            task.interval_unit,
         )
 
         self._tasks[task_id] = task
-        await self.async_save()
-        _LOGGER.debug("Added task: %s (%s)", task["name"], task_id)
+        self._async_task_changed(task_id)
+        _LOGGER.debug("Added task: %s (%s)", task.name, task_id)
         return task
 
     async def async_update_task(
         self, task_id: str, task_data: dict[str, Any]
-    ) -> dict[str, Any] | None:
+    ) -> Task | None:
         """Update an existing task."""
         if task_id not in self._tasks:
             _LOGGER.warning("Task not found: %s", task_id)
             return None
 
-        task = self._tasks[task_id]
+        # Parse everything first, so an invalid value changes nothing
+        changes = {
+            key: Task.parse_field(key, task_data[key])
+            for key in UPDATE_FIELDS
+            if key in task_data
+        }
 
-        for key in (
-            "name",
-            "description",
-            "manufacturer",
-            "category",
-            "priority",
-            "interval_value",
-            "interval_unit",
-            "last_completed",
-        ):
-            if key in task_data:
-                task[key] = task_data[key]
+        task = self._edit_task(task_id)
+        for key, value in changes.items():
+            setattr(task, key, value)
 
-        task["updated_at"] = datetime.now().isoformat()
+        task.updated_at = dt_util.now().isoformat()
 
         # Recalculate next_due
-        task["next_due"] = _calculate_next_due(
-            task["last_completed"],
-            task["interval_value"],
-            task["interval_unit"],
-            task.get("snoozed_until"),
+        task.next_due = _calculate_next_due(
+            task.last_completed,
+            task.interval_value,
+            task.interval_unit,
+            task.snoozed_until,
         )
 
-        await self.async_save()
-        _LOGGER.debug("Updated task: %s (%s)", task["name"], task_id)
+        self._async_task_changed(task_id)
+        _LOGGER.debug("Updated task: %s (%s)", task.name, task_id)
         return task
 
     async def async_delete_task(self, task_id: str) -> bool:
@@ -189,68 +677,217 @@ class WartungsplanerStore:
             _LOGGER.warning("Task not found for deletion: %s", task_id)
             return False
 
-        name = self._tasks[task_id]["name"]
-        del self._tasks[task_id]
-        await self.async_save()
+        name = self._tasks.pop(task_id).name
+        if self._history.pop(task_id, None) is not None:
+            self.async_schedule_history_save()
+        self._async_task_changed(task_id)
         _LOGGER.debug("Deleted task: %s (%s)", name, task_id)
         return True
 
     async def async_complete_task(
         self, task_id: str, notes: str | None = None
-    ) -> dict[str, Any] | None:
+    ) -> Task | None:
         """Mark a task as completed."""
         if task_id not in self._tasks:
             _LOGGER.warning("Task not found for completion: %s", task_id)
             return None
 
-        task = self._tasks[task_id]
-        today = date.today().isoformat()
+        task = self._edit_task(task_id)
+        today = dt_util.now().date()
 
         completion_entry = {
-            "date": today,
+            "date": today.isoformat(),
             "notes": notes or "",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": dt_util.now().isoformat(),
         }
-        task["completion_history"].append(completion_entry)
-        task["last_completed"] = today
-        task["snoozed_until"] = None
+        # Histories are replaced, not modified, as snapshots share them
+        history = _copy_history(self._history.get(task_id))
+        history["entries"].append(completion_entry)
+        _compact_history(history, self.history_retention)
+        self._history[task_id] = history
+        self.async_schedule_history_save()
+
+        task.completion_count += 1
+        task.last_completed = today
+        task.snoozed_until = None
 
         # Recalculate next_due
-        task["next_due"] = _calculate_next_due(
-            task["last_completed"],
-            task["interval_value"],
-            task["interval_unit"],
+        task.next_due = _calculate_next_due(
+            task.last_completed,
+            task.interval_value,
+            task.interval_unit,
         )
-        task["updated_at"] = datetime.now().isoformat()
+        task.updated_at = dt_util.now().isoformat()
 
-        await self.async_save()
-        _LOGGER.debug("Completed task: %s (%s)", task["name"], task_id)
+        self._async_task_changed(task_id)
+        _LOGGER.debug("Completed task: %s (%s)", task.name, task_id)
         return task
 
     async def async_snooze_task(
-        self, task_id: str, until_date: str
-    ) -> dict[str, Any] | None:
+        self, task_id: str, until_date: str | date
+    ) -> Task | None:
         """Snooze a task until a specific date."""
         if task_id not in self._tasks:
             _LOGGER.warning("Task not found for snooze: %s", task_id)
             return None
 
-        task = self._tasks[task_id]
-        task["snoozed_until"] = until_date
+        snoozed_until = parse_date(until_date)
+        task = self._edit_task(task_id)
+        task.snoozed_until = snoozed_until
 
         # Recalculate next_due with snooze
-        task["next_due"] = _calculate_next_due(
-            task["last_completed"],
-            task["interval_value"],
-            task["interval_unit"],
-            until_date,
+        task.next_due = _calculate_next_due(
+            task.last_completed,
+            task.interval_value,
+            task.interval_unit,
+            task.snoozed_until,
         )
-        task["updated_at"] = datetime.now().isoformat()
+        task.updated_at = dt_util.now().isoformat()
 
-        await self.async_save()
-        _LOGGER.debug("Snoozed task: %s until %s", task["name"], until_date)
+        self._async_task_changed(task_id)
+        _LOGGER.debug("Snoozed task: %s until %s", task.name, until_date)
         return task
 
+    def _validate_bulk(self, operations: list[dict[str, Any]]) -> list[str | None]:
+        """Return an error code (or None) for each bulk operation."""
+        known_ids = set(self._tasks)
+        errors: list[str | None] = []
+        for operation in operations:
+            error = None
+            if operation["op"] != "add" and operation["task_id"] not in known_ids:
+                error = "not_found"
+            for key in BULK_DATE_FIELDS:
+                if error is None and operation.get(key):
+                    try:
+                        parse_date(operation[key])
+                    except (TypeError, ValueError):
+                        error = "invalid_date"
+            if error is None and operation["op"] == "delete":
+                known_ids.discard(operation["task_id"])
+            errors.append(error)
+        return errors
+
+    async def async_bulk(
+        self, operations: list[dict[str, Any]]
+    ) -> tuple[bool, list[dict[str, Any]]]:
+        """Apply a list of task operations atomically.
+
+        Every operation is validated before anything is changed. If one of
+        them fails, none are applied. All changes share one delayed save.
+        Returns whether the batch was applied and a result per operation.
+        """
+        errors = self._validate_bulk(operations)
+        if any(errors):
+            return False, [
+                {"index": index, "success": False, "error": error}
+                if error
+                else {"index": index, "success": True}
+                for index, error in enumerate(errors)
+            ]
+
+        results: list[dict[str, Any]] = []
+        for index, operation in enumerate(operations):
+            op = operation["op"]
+            task_id = operation.get("task_id")
+            task: Task | None = None
+            if op == "add":
+                task = await self.async_add_task(operation)
+                task_id = task.id
+            elif op == "update":
+                task = await self.async_update_task(
+                    task_id,
+                    {k: v for k, v in operation.items() if k not in ("op", "task_id")},
+                )
+            elif op == "complete":
+                task = await self.async_complete_task(task_id, operation.get("notes"))
+            elif op == "snooze":
+                task = await self.async_snooze_task(task_id, operation["until_date"])
+            elif op == "delete":
+                await self.async_delete_task(task_id)
+            results.append(
+                {
+                    "index": index,
+                    "success": True,
+                    "task_id": task_id,
+                    "task": task.as_dict() if task is not None else None,
+                }
+            )
+
+        _LOGGER.debug("Applied %d bulk operations", len(operations))
+        return True, results
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[str, int]]:
+        """Return (task ID, score) of tasks matching a search query, best first."""
+        return self._search_index.search(query)[:limit]
+
+    def get_history(
+        self, task_id: str, offset: int = 0, limit: int = 20
+    ) -> dict[str, Any] | None:
+        """Return a page of a task's completion history, newest first."""
+        if task_id not in self._tasks:
+            return None
+        history = self._history.get(task_id, {"entries": [], "summaries": {}})
+        entries = history["entries"]
+        end = len(entries) - offset
+        start = max(end - limit, 0)
+        return {
+            "entries": entries[start:end][::-1] if end > 0 else [],
+            "total": len(entries),
+            "summaries": [
+                {"year": year, **summary}
+                for year, summary in sorted(history["summaries"].items(), reverse=True)
+            ],
+        }
+
+    def get_full_history(self, task_id: str) -> dict[str, Any] | None:
+        """Return all completion history entries and summaries of a task."""
+        return self._history.get(task_id)
+
+    async def async_import(
+        self,
+        tasks: dict[str, dict[str, Any]],
+        history: dict[str, dict[str, Any]],
+        templates: dict[str, dict[str, Any]],
+        categories: dict[str, dict[str, Any]],
+    ) -> dict[str, int]:
+        """Add or replace tasks, history, custom templates and categories.
+
+        Tasks keep their IDs, so importing an export again updates the same
+        tasks. Due dates are recalculated. All changes share one delayed
+        save per touched file.
+        """
+        now = dt_util.now().isoformat()
+        for task_id, task_data in tasks.items():
+            task = Task.from_dict(task_data)
+            task.created_at = task.created_at or now
+            task.updated_at = now
+            task.next_due = _calculate_next_due(
+                task.last_completed,
+                task.interval_value,
+                task.interval_unit,
+                task.snoozed_until,
+            )
+            self._tasks[task_id] = task
+            self._async_task_changed(task_id)
+        for task_id, task_history in history.items():
+            _compact_history(task_history, self.history_retention)
+            self._history[task_id] = task_history
+        if history:
+            self.async_schedule_history_save()
+        self._custom_templates.update(templates)
+        self._custom_categories.update(categories)
+        if templates:
+            self._async_invalidate_templates()
+        if templates or categories:
+            self.async_schedule_save()
+        _LOGGER.debug("Imported %d tasks", len(tasks))
+        return {
+            "tasks": len(tasks),
+            "history": len(history),
+            "templates": len(templates),
+            "categories": len(categories),
+        }
+
     async def async_add_custom_template(
         self, data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -267,7 +904,8 @@ class WartungsplanerStore:
             "builtin": False,
         }
         self._custom_templates[template_id] = template
-        await self.async_save()
+        self._async_invalidate_templates()
+        self.async_schedule_save()
         _LOGGER.debug("Added custom template: %s (%s)", template["name"], template_id)
         return template
 
@@ -278,7 +916,8 @@ class WartungsplanerStore:
             return False
         name = self._custom_templates[template_id]["name"]
         del self._custom_templates[template_id]
-        await self.async_save()
+        self._async_invalidate_templates()
+        self.async_schedule_save()
         _LOGGER.debug("Deleted custom template: %s (%s)", name, template_id)
         return True
 
@@ -295,27 +934,29 @@ class WartungsplanerStore:
             "icon": data.get("icon", "mdi:dots-horizontal"),
         }
         self._custom_categories[cat_id] = category
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.debug("Added custom category: %s (%s)", category["name_de"], cat_id)
         return category
 
     async def async_update_settings(self, data: dict[str, Any]) -> dict[str, Any]:
         """Update settings."""
         self._settings.update(data)
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.debug("Updated settings: %s", data)
         return self._settings
 
     async def async_hide_builtin_template(self, template_id: str) -> None:
         """Hide a builtin template."""
         self._hidden_templates.add(template_id)
-        await self.async_save()
+        self._async_invalidate_templates()
+        self.async_schedule_save()
         _LOGGER.debug("Hidden builtin template: %s", template_id)
 
     async def async_restore_hidden_templates(self) -> None:
         """Restore all hidden builtin templates."""
         self._hidden_templates.clear()
-        await self.async_save()
+        self._async_invalidate_templates()
+        self.async_schedule_save()
         _LOGGER.debug("Restored all hidden builtin templates")
 
     async def async_delete_category(self, cat_id: str) -> bool:
@@ -324,11 +965,10 @@ class WartungsplanerStore:
             _LOGGER.warning("Custom category not found: %s", cat_id)
             return False
         # Check if any task uses this category
-        for task in self._tasks.values():
-            if task.get("category") == cat_id:
-                return False
+        if self._category_index.count(cat_id):
+            return False
         name = self._custom_categories[cat_id]["name_de"]
         del self._custom_categories[cat_id]
-        await self.async_save()
+        self.async_schedule_save()
         _LOGGER.debug("Deleted custom category: %s (%s)", name, cat_id)
         return True
@@ -0,0 +1,56 @@
+"""Secondary task indexes for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+from collections.abc import Set
+
+_EMPTY: frozenset[str] = frozenset()
+
+
+class TaskIndex:
+    """Map the value of one task attribute to the IDs of tasks having it.
+
+    Lookups and counts per value are O(1), so filters and in-use checks do
+    not have to scan all tasks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._ids: dict[str, set[str]] = {}
+        self._values: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._values)
+
+    def set(self, task_id: str, value: str) -> None:
+        """Index a task under a value, moving it from its previous one."""
+        old = self._values.get(task_id)
+        if old == value:
+            return
+        if old is not None:
+            self.discard(task_id)
+        self._values[task_id] = value
+        self._ids.setdefault(value, set()).add(task_id)
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task from the index."""
+        value = self._values.pop(task_id, None)
+        if value is None:
+            return
+        ids = self._ids[value]
+        ids.discard(task_id)
+        if not ids:
+            del self._ids[value]
+
+    def get(self, value: str) -> Set[str]:
+        """Return the IDs of tasks with a value. Do not modify the result."""
+        return self._ids.get(value, _EMPTY)
+
+    def count(self, value: str) -> int:
+        """Return the number of tasks with a value."""
+        return len(self._ids.get(value, _EMPTY))
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of tasks per value."""
+        return {value: len(ids) for value, ids in self._ids.items()}
@@ -420,19 +420,29 @@ TASK_TEMPLATES: list[dict] = [
 ]
 
 
+# Built once at import: lookup tables and the payload sent to the frontend
+_TEMPLATES_BY_ID: dict[str, dict] = {t["id"]: t for t in TASK_TEMPLATES}
+_TEMPLATES_BY_CATEGORY: dict[str, list[dict]] = {}
+for _template in TASK_TEMPLATES:
+    _TEMPLATES_BY_CATEGORY.setdefault(_template["category"], []).append(_template)
+_BUILTIN_PAYLOAD: tuple[dict, ...] = tuple(
+    {**t, "builtin": True} for t in TASK_TEMPLATES
+)
+
+
 def get_templates() -> list[dict]:
-    """Return all available task templates."""
-    return [{**t, "builtin": True} for t in TASK_TEMPLATES]
+    """Return all available task templates.
+
+    The dicts are shared and must not be modified.
+    """
+    return list(_BUILTIN_PAYLOAD)
 
 
 def get_template_by_id(template_id: str) -> dict | None:
     """Return a specific template by its ID."""
-    for template in TASK_TEMPLATES:
-        if template["id"] == template_id:
-            return template
-    return None
+    return _TEMPLATES_BY_ID.get(template_id)
 
 
 def get_templates_by_category(category: str) -> list[dict]:
     """Return templates filtered by category."""
-    return [t for t in TASK_TEMPLATES if t["category"] == category]
+    return list(_TEMPLATES_BY_CATEGORY.get(category, ()))
@@ -0,0 +1,333 @@
+"""Export and import of tasks for the Wartungsplaner integration."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+from collections.abc import Iterator
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.util import dt as dt_util
+
+from .const import IntervalUnit, TaskPriority
+from .models import Task
+
+if TYPE_CHECKING:
+    from .store import WartungsplanerStore
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 500
+# Larger minimum chunks keep the number of WebSocket messages bounded
+MIN_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 5000
+MAX_IMPORT_ERRORS = 100
+
+# CSV exports hold tasks only, one row per task
+CSV_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "manufacturer",
+    "category",
+    "priority",
+    "interval_value",
+    "interval_unit",
+    "last_completed",
+    "next_due",
+    "snoozed_until",
+    "completion_count",
+    "created_at",
+    "updated_at",
+)
+
+
+def _optional_date(value: Any) -> str | None:
+    """Validate an ISO date, treating empty values as missing."""
+    if value in (None, ""):
+        return None
+    try:
+        date.fromisoformat(value)
+    except (TypeError, ValueError) as err:
+        raise vol.Invalid(f"invalid date: {value}") from err
+    return value
+
+
+TASK_RECORD_SCHEMA = vol.Schema(
+    {
+        # Tasks without an ID are imported as new tasks
+        vol.Optional("id"): str,
+        vol.Required("name"): vol.All(str, vol.Length(min=1)),
+        vol.Optional("description", default=""): str,
+        vol.Optional("manufacturer", default=""): str,
+        vol.Optional("category", default="other"): vol.All(str, vol.Length(min=1)),
+        vol.Optional("priority", default="medium"): vol.In(
+            [e.value for e in TaskPriority]
+        ),
+        vol.Optional("interval_value", default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional("interval_unit", default="months"): vol.In(
+            [e.value for e in IntervalUnit]
+        ),
+        vol.Optional("last_completed"): _optional_date,
+        vol.Optional("snoozed_until"): _optional_date,
+        vol.Optional("completion_count", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional("created_at", default=""): str,
+        vol.Optional("updated_at", default=""): str,
+    },
+    # Computed fields such as next_due and status are recalculated
+    extra=vol.REMOVE_EXTRA,
+)
+
+HISTORY_RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required("task_id"): str,
+        vol.Optional("entries", default=list): [
+            vol.Schema(
+                {
+                    vol.Required("date"): vol.All(_optional_date, str),
+                    vol.Optional("notes", default=""): str,
+                    vol.Optional("timestamp", default=""): str,
+                }
+            )
+        ],
+        vol.Optional("summaries", default=dict): {
+            str: vol.Schema(
+                {
+                    vol.Required("count"): vol.All(int, vol.Range(min=0)),
+                    vol.Required("first"): str,
+                    vol.Required("last"): str,
+                }
+            )
+        },
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+TEMPLATE_RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required("id"): vol.All(str, vol.Length(min=1)),
+        vol.Required("name"): str,
+        vol.Optional("description", default=""): str,
+        vol.Optional("category", default="other"): str,
+        vol.Optional("priority", default="medium"): vol.In(
+            [e.value for e in TaskPriority]
+        ),
+        vol.Optional("interval_value", default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional("interval_unit", default="months"): vol.In(
+            [e.value for e in IntervalUnit]
+        ),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+CATEGORY_RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required("id"): vol.All(str, vol.Length(min=1)),
+        vol.Required("name_de"): str,
+        vol.Required("name_en"): str,
+        vol.Optional("icon", default="mdi:dots-horizontal"): str,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def _dumps(record: dict[str, Any]) -> str:
+    """Return one NDJSON line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _csv_header() -> str:
+    """Return the CSV header line."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_COLUMNS)
+    return buffer.getvalue()
+
+
+def _csv_row(task: Task) -> str:
+    """Return one CSV line for a task."""
+    buffer = io.StringIO()
+    data = task.as_dict()
+    csv.writer(buffer).writerow(
+        ["" if data[column] is None else data[column] for column in CSV_COLUMNS]
+    )
+    return buffer.getvalue()
+
+
+def iter_export(store: WartungsplanerStore, export_format: str) -> Iterator[str]:
+    """Yield the export one record at a time.
+
+    NDJSON exports hold custom categories, custom templates, tasks and
+    their completion history. Records are built only when requested, so
+    the whole document never exists in memory at once.
+    """
+    task_ids = list(store.tasks)
+    if export_format == "csv":
+        yield _csv_header()
+        for task_id in task_ids:
+            if (task := store.tasks.get(task_id)) is not None:
+                yield _csv_row(task)
+        return
+
+    yield _dumps(
+        {
+            "type": "meta",
+            "version": EXPORT_VERSION,
+            "exported_at": dt_util.now().isoformat(),
+            "tasks": len(task_ids),
+        }
+    )
+    for category in list(store.custom_categories.values()):
+        yield _dumps({"type": "category", **category})
+    for template in list(store.custom_templates.values()):
+        yield _dumps({"type": "template", **template})
+    for task_id in task_ids:
+        task = store.tasks.get(task_id)
+        if task is None:
+            continue
+        yield _dumps({"type": "task", **task.as_dict()})
+        history = store.get_full_history(task_id)
+        if history is not None:
+            yield _dumps({"type": "history", "task_id": task_id, **history})
+
+
+def iter_chunks(records: Iterator[str], chunk_size: int) -> Iterator[tuple[str, int]]:
+    """Join records into chunks of at most chunk_size records."""
+    chunk: list[str] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk), len(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk), len(chunk)
+
+
+class ImportParser:
+    """Parse and validate an export that arrives in chunks.
+
+    Chunks may end anywhere, also inside a line or a quoted CSV field.
+    Invalid records are collected as errors with their line number.
+    """
+
+    def __init__(self, import_format: str) -> None:
+        """Initialize an empty import."""
+        self.format = import_format
+        self.tasks: dict[str, dict[str, Any]] = {}
+        self.history: dict[str, dict[str, Any]] = {}
+        self.templates: dict[str, dict[str, Any]] = {}
+        self.categories: dict[str, dict[str, Any]] = {}
+        self.errors: list[dict[str, Any]] = []
+        self.records = 0
+        self._pending = ""
+        self._line = 0
+        self._record_start = 0
+        self._record_lines: list[str] = []
+        self._csv_header: list[str] | None = None
+
+    def feed(self, text: str) -> None:
+        """Parse all complete lines of a chunk."""
+        lines = (self._pending + text).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self._parse_line(line + "\n")
+
+    def close(self) -> None:
+        """Parse the remaining input and check references between records."""
+        if self._pending:
+            self._parse_line(self._pending)
+            self._pending = ""
+        if self._record_lines:
+            self._error(self._record_start, "unterminated quoted field")
+            self._record_lines = []
+        for task_id in self.history.keys() - self.tasks.keys():
+            self._error(0, f"history of unknown task {task_id}")
+
+    def _error(self, line: int, message: str) -> None:
+        """Record an error, up to MAX_IMPORT_ERRORS."""
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def _parse_line(self, line: str) -> None:
+        """Parse one line of input."""
+        self._line += 1
+        if self.format == "csv":
+            self._parse_csv_line(line)
+        elif line.strip():
+            self._parse_json_line(line)
+
+    def _parse_json_line(self, line: str) -> None:
+        """Parse one NDJSON record."""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            self._error(self._line, "invalid JSON")
+            return
+        if not isinstance(record, dict):
+            self._error(self._line, "record is not an object")
+            return
+        self._add_record(self._line, record.pop("type", None), record)
+
+    def _parse_csv_line(self, line: str) -> None:
+        """Collect lines until a CSV record is complete, then parse it."""
+        if not self._record_lines:
+            self._record_start = self._line
+        self._record_lines.append(line)
+        text = "".join(self._record_lines)
+        # Quotes are escaped by doubling, so an odd count means the record
+        # continues inside a quoted field on the next line
+        if text.count('"') % 2:
+            return
+        self._record_lines = []
+        if not text.strip():
+            return
+        row = next(csv.reader(io.StringIO(text)))
+        if self._csv_header is None:
+            self._csv_header = row
+            return
+        if len(row) != len(self._csv_header):
+            self._error(self._record_start, "wrong number of columns")
+            return
+        self._add_record(
+            self._record_start, "task", dict(zip(self._csv_header, row, strict=True))
+        )
+
+    def _add_record(self, line: int, record_type: Any, record: dict[str, Any]) -> None:
+        """Validate a record and add it to the import."""
+        if record_type == "meta":
+            version = record.get("version", EXPORT_VERSION)
+            if not isinstance(version, int) or version > EXPORT_VERSION:
+                self._error(line, "unsupported export version")
+            return
+        try:
+            if record_type == "task":
+                task = TASK_RECORD_SCHEMA(record)
+                if not task.get("id"):
+                    task["id"] = str(uuid.uuid4())
+                self.tasks[task["id"]] = task
+            elif record_type == "history":
+                history = HISTORY_RECORD_SCHEMA(record)
+                self.history[history.pop("task_id")] = history
+            elif record_type == "template":
+                template = TEMPLATE_RECORD_SCHEMA(record)
+                self.templates[template["id"]] = {**template, "builtin": False}
+            elif record_type == "category":
+                category = CATEGORY_RECORD_SCHEMA(record)
+                self.categories[category["id"]] = category
+            else:
+                self._error(line, f"unknown record type {record_type}")
+                return
+        except vol.Invalid as err:
+            self._error(line, str(err))
+            return
+        self.records += 1
@@ -2,35 +2,130 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import uuid
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CATEGORY_ICONS,
     CATEGORY_LABELS,
     DOMAIN,
+    AttributeProfile,
     IntervalUnit,
     TaskCategory,
     TaskPriority,
+    TaskStatus,
+)
+from .models import TaskState
+from .query import (
+    SORT_KEYS,
+    TASK_FIELDS,
+    InvalidCursor,
+    filter_tasks,
+    page_tasks,
+    project_task,
+)
+from .templates import get_template_by_id, get_templates_by_category
+from .transfer import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    ImportParser,
+    iter_chunks,
+    iter_export,
 )
-from .templates import get_template_by_id, get_templates
 
 _LOGGER = logging.getLogger(__name__)
 
+# Export chunks sent before pausing for the connection to catch up
+EXPORT_BATCH_CHUNKS = 32
+EXPORT_BATCH_PAUSE = 0.05  # seconds
+
+TASK_FIELDS_SCHEMA = {
+    vol.Optional("description"): str,
+    vol.Optional("manufacturer"): str,
+    vol.Optional("category"): str,
+    vol.Optional("priority"): vol.In([e.value for e in TaskPriority]),
+    vol.Optional("interval_value"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional("interval_unit"): vol.In([e.value for e in IntervalUnit]),
+    vol.Optional("last_completed"): str,
+}
+
+# Options of get_tasks that switch to a filtered, sorted and paged list
+TASK_QUERY_SCHEMA = {
+    vol.Optional("category"): vol.All(cv.ensure_list, [str]),
+    vol.Optional("status"): vol.All(
+        cv.ensure_list, [vol.In([e.value for e in TaskStatus])]
+    ),
+    vol.Optional("priority"): vol.All(
+        cv.ensure_list, [vol.In([e.value for e in TaskPriority])]
+    ),
+    vol.Optional("due_from"): cv.date,
+    vol.Optional("due_before"): cv.date,
+    vol.Optional("text"): str,
+    vol.Optional("sort"): vol.In(list(SORT_KEYS)),
+    vol.Optional("descending"): bool,
+    vol.Optional("cursor"): str,
+    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    vol.Optional("fields"): vol.All(cv.ensure_list, [vol.In(TASK_FIELDS)]),
+}
+
+BULK_OPERATION_SCHEMA = vol.Any(
+    vol.Schema(
+        {vol.Required("op"): "add", vol.Required("name"): str, **TASK_FIELDS_SCHEMA}
+    ),
+    vol.Schema(
+        {
+            vol.Required("op"): "update",
+            vol.Required("task_id"): str,
+            vol.Optional("name"): str,
+            **TASK_FIELDS_SCHEMA,
+        }
+    ),
+    vol.Schema(
+        {
+            vol.Required("op"): "complete",
+            vol.Required("task_id"): str,
+            vol.Optional("notes", default=""): str,
+        }
+    ),
+    vol.Schema(
+        {
+            vol.Required("op"): "snooze",
+            vol.Required("task_id"): str,
+            vol.Required("until_date"): str,
+        }
+    ),
+    vol.Schema({vol.Required("op"): "delete", vol.Required("task_id"): str}),
+)
+
 
 def async_register_websocket_api(hass: HomeAssistant) -> None:
     """Register WebSocket API handlers."""
     websocket_api.async_register_command(hass, ws_get_tasks)
+    websocket_api.async_register_command(hass, ws_subscribe)
+    websocket_api.async_register_command(hass, ws_search)
+    websocket_api.async_register_command(hass, ws_get_next_due)
+    websocket_api.async_register_command(hass, ws_get_due_tasks)
     websocket_api.async_register_command(hass, ws_add_task)
     websocket_api.async_register_command(hass, ws_update_task)
     websocket_api.async_register_command(hass, ws_delete_task)
     websocket_api.async_register_command(hass, ws_complete_task)
+    websocket_api.async_register_command(hass, ws_bulk)
+    websocket_api.async_register_command(hass, ws_export)
+    websocket_api.async_register_command(hass, ws_import)
+    websocket_api.async_register_command(hass, ws_get_history)
     websocket_api.async_register_command(hass, ws_get_templates)
     websocket_api.async_register_command(hass, ws_add_from_template)
+    websocket_api.async_register_command(hass, ws_add_from_templates)
     websocket_api.async_register_command(hass, ws_snooze_task)
     websocket_api.async_register_command(hass, ws_get_categories)
     websocket_api.async_register_command(hass, ws_add_category)
@@ -53,9 +148,38 @@ def _get_store(hass: HomeAssistant):
     return hass.data[DOMAIN]["store"]
 
 
+def _serialize_tasks(tasks: dict[str, TaskState]) -> dict[str, dict[str, Any]]:
+    """Return the JSON representation of computed task states."""
+    return {task_id: state.as_dict() for task_id, state in tasks.items()}
+
+
+def _query_task_ids(hass: HomeAssistant, msg: dict[str, Any]) -> set[str] | None:
+    """Return the IDs of tasks matching the indexed filters of a query.
+
+    Returns None if the query has no such filter.
+    """
+    store = _get_store(hass)
+    coordinator = _get_coordinator(hass)
+    candidates: list[set[str]] = []
+    for key, lookup in (
+        ("category", store.task_ids_by_category),
+        ("priority", store.task_ids_by_priority),
+        ("status", coordinator.get_task_ids_by_status),
+    ):
+        if key in msg:
+            candidates.append(set().union(*(lookup(value) for value in msg[key])))
+    if "text" in msg:
+        candidates.append({task_id for task_id, _ in store.search(msg["text"])})
+    if not candidates:
+        return None
+    candidates.sort(key=len)
+    return candidates[0].intersection(*candidates[1:])
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "wartungsplaner/get_tasks",
+        **TASK_QUERY_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -64,11 +188,230 @@ async def ws_get_tasks(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle get tasks WebSocket command."""
+    """Handle get tasks WebSocket command.
+
+    Without query options all tasks are returned keyed by ID. With any of
+    them, the matching tasks are returned as a sorted list, one page at a
+    time, optionally limited to some fields.
+    """
     coordinator = _get_coordinator(hass)
-    await coordinator.async_refresh()
+    # Serve the cached snapshot; only recompute if it is out of date
+    await coordinator.async_ensure_fresh()
+    data = coordinator.data or {"tasks": {}, "stats": {}}
+    if not any(key in msg for key in TASK_QUERY_SCHEMA):
+        connection.send_result(
+            msg["id"],
+            {"tasks": _serialize_tasks(data["tasks"]), "stats": data["stats"]},
+        )
+        return
+
+    task_ids = _query_task_ids(hass, msg)
+    if "due_from" in msg or "due_before" in msg:
+        # The due index only yields tasks in the range
+        states = coordinator.get_tasks_due_between(
+            msg.get("due_from"), msg.get("due_before")
+        )
+    elif task_ids is not None:
+        states = [
+            data["tasks"][task_id] for task_id in task_ids if task_id in data["tasks"]
+        ]
+    else:
+        states = data["tasks"].values()
+    states = filter_tasks(
+        states,
+        categories=msg.get("category"),
+        statuses=msg.get("status"),
+        priorities=msg.get("priority"),
+        task_ids=task_ids,
+    )
+    try:
+        page, next_cursor = page_tasks(
+            states,
+            sort=msg.get("sort", "status"),
+            descending=msg.get("descending", False),
+            cursor=msg.get("cursor"),
+            limit=msg.get("limit"),
+        )
+    except InvalidCursor:
+        connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+        return
+
+    fields = msg.get("fields")
+    connection.send_result(
+        msg["id"],
+        {
+            "tasks": [project_task(state, fields) for state in page],
+            "total": len(states),
+            "next_cursor": next_cursor,
+            "stats": data["stats"],
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/subscribe",
+    }
+)
+@websocket_api.async_response
+async def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle subscribe WebSocket command.
+
+    Sends one snapshot of all tasks and stats, then a delta with added,
+    changed and removed tasks and changed stats after every coordinator
+    update that touched something.
+    """
+    coordinator = _get_coordinator(hass)
+    await coordinator.async_ensure_fresh()
     data = coordinator.data or {"tasks": {}, "stats": {}}
-    connection.send_result(msg["id"], data)
+    last_stats = dict(data["stats"])
+
+    @callback
+    def forward_changes() -> None:
+        """Send the changes of the last coordinator update."""
+        if not coordinator.last_update_success or coordinator.data is None:
+            return
+        changes = coordinator.last_changes
+        tasks = coordinator.data["tasks"]
+        stats_delta = {
+            key: value
+            for key, value in coordinator.data["stats"].items()
+            if last_stats.get(key) != value
+        }
+        if not (
+            changes.added or changes.changed or changes.removed or stats_delta
+        ):
+            return
+        last_stats.update(stats_delta)
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"],
+                {
+                    "type": "delta",
+                    "added": {
+                        task_id: tasks[task_id].as_dict() for task_id in changes.added
+                    },
+                    "changed": {
+                        task_id: tasks[task_id].as_dict()
+                        for task_id in changes.changed
+                    },
+                    "removed": list(changes.removed),
+                    "stats": stats_delta,
+                },
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(
+        forward_changes
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "type": "snapshot",
+                "tasks": _serialize_tasks(data["tasks"]),
+                "stats": data["stats"],
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/search",
+        vol.Required("query"): str,
+        vol.Optional("limit"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional("fields"): vol.All(cv.ensure_list, [vol.In(TASK_FIELDS)]),
+    }
+)
+@websocket_api.async_response
+async def ws_search(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle search WebSocket command.
+
+    Matches every word of the query as a prefix of the words in task
+    names, manufacturers and descriptions. Best matches come first.
+    """
+    store = _get_store(hass)
+    coordinator = _get_coordinator(hass)
+    await coordinator.async_ensure_fresh()
+    tasks = (coordinator.data or {"tasks": {}})["tasks"]
+    matches = store.search(msg["query"])
+    fields = msg.get("fields")
+    connection.send_result(
+        msg["id"],
+        {
+            "results": [
+                {"score": score, "task": project_task(tasks[task_id], fields)}
+                for task_id, score in matches[: msg.get("limit")]
+                if task_id in tasks
+            ],
+            "total": len(matches),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/get_next_due",
+    }
+)
+@callback
+def ws_get_next_due(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle get next due task WebSocket command."""
+    coordinator = _get_coordinator(hass)
+    state = coordinator.get_next_due_task(dt_util.now().date())
+    connection.send_result(
+        msg["id"], {"task": state.as_dict() if state is not None else None}
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/get_due_tasks",
+        vol.Optional("overdue", default=False): bool,
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+@callback
+def ws_get_due_tasks(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle get due tasks WebSocket command.
+
+    Returns overdue tasks (most overdue first) or tasks due in [start, end),
+    ordered by due date.
+    """
+    coordinator = _get_coordinator(hass)
+    limit = msg.get("limit")
+
+    if msg["overdue"]:
+        states = coordinator.get_overdue_tasks(dt_util.now().date(), limit)
+    else:
+        states = coordinator.get_tasks_due_between(
+            msg.get("start"), msg.get("end"), limit
+        )
+    connection.send_result(
+        msg["id"], {"tasks": [state.as_dict() for state in states]}
+    )
 
 
 @websocket_api.websocket_command(
@@ -87,7 +430,7 @@ async def ws_get_tasks(
         vol.Optional("interval_unit", default="months"): vol.In(
             [e.value for e in IntervalUnit]
         ),
-        vol.Optional("last_completed"): str,
+        vol.Optional("last_completed"): cv.date,
     }
 )
 @websocket_api.async_response
@@ -113,7 +456,7 @@ async def ws_add_task(
 
     task = await store.async_add_task(task_data)
     await coordinator.async_refresh()
-    connection.send_result(msg["id"], {"task": task})
+    connection.send_result(msg["id"], {"task": task.as_dict()})
 
 
 @websocket_api.websocket_command(
@@ -131,7 +474,7 @@ async def ws_add_task(
         vol.Optional("interval_unit"): vol.In(
             [e.value for e in IntervalUnit]
         ),
-        vol.Optional("last_completed"): str,
+        vol.Optional("last_completed"): cv.date,
     }
 )
 @websocket_api.async_response
@@ -157,7 +500,7 @@ async def ws_update_task(
         return
 
     await coordinator.async_refresh()
-    connection.send_result(msg["id"], {"task": task})
+    connection.send_result(msg["id"], {"task": task.as_dict()})
 
 
 @websocket_api.websocket_command(
@@ -208,12 +551,157 @@ async def ws_complete_task(
         return
 
     await coordinator.async_refresh()
-    connection.send_result(msg["id"], {"task": task})
+    connection.send_result(msg["id"], {"task": task.as_dict()})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/bulk",
+        vol.Required("operations"): [BULK_OPERATION_SCHEMA],
+    }
+)
+@websocket_api.async_response
+async def ws_bulk(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle bulk WebSocket command (add/update/complete/snooze/delete)."""
+    store = _get_store(hass)
+    coordinator = _get_coordinator(hass)
+
+    applied, results = await store.async_bulk(msg["operations"])
+    if applied:
+        await coordinator.async_refresh()
+    connection.send_result(msg["id"], {"applied": applied, "results": results})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/export",
+        vol.Optional("format", default="ndjson"): vol.In(EXPORT_FORMATS),
+        vol.Optional("chunk_size", default=DEFAULT_CHUNK_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_CHUNK_SIZE, max=MAX_CHUNK_SIZE)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_export(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle export WebSocket command.
+
+    Streams the export as events holding a chunk of records each, followed
+    by an event with done set. Chunks are sent in batches with a pause in
+    between, so the connection can send them before its queue of pending
+    messages fills up.
+    """
+    store = _get_store(hass)
+    connection.send_result(msg["id"])
+    records = 0
+    for index, (chunk, count) in enumerate(
+        iter_chunks(iter_export(store, msg["format"]), msg["chunk_size"]), 1
+    ):
+        records += count
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"chunk": chunk})
+        )
+        await asyncio.sleep(
+            EXPORT_BATCH_PAUSE if index % EXPORT_BATCH_CHUNKS == 0 else 0
+        )
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"done": True, "records": records})
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/import",
+        vol.Required("data"): str,
+        vol.Optional("format", default="ndjson"): vol.In(EXPORT_FORMATS),
+        vol.Optional("session"): str,
+        vol.Optional("final", default=True): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_import(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle import WebSocket command.
+
+    Large imports are sent in chunks: the first message opens a session,
+    the following ones pass its ID, and the one with final set applies the
+    import. Nothing is applied if any record is invalid.
+    """
+    sessions: dict[str, ImportParser] = hass.data[DOMAIN].setdefault("imports", {})
+    session_id = msg.get("session")
+    if session_id is None:
+        session_id = uuid.uuid4().hex
+        sessions[session_id] = ImportParser(msg["format"])
+        # Drop unfinished imports when the connection closes
+        connection.subscriptions[msg["id"]] = lambda: sessions.pop(session_id, None)
+    parser = sessions.get(session_id)
+    if parser is None:
+        connection.send_error(msg["id"], "not_found", "Import session not found")
+        return
+
+    parser.feed(msg["data"])
+    if not msg["final"]:
+        connection.send_result(
+            msg["id"], {"session": session_id, "records": parser.records}
+        )
+        return
+
+    del sessions[session_id]
+    parser.close()
+    if parser.errors:
+        connection.send_result(
+            msg["id"], {"applied": False, "errors": parser.errors}
+        )
+        return
+    store = _get_store(hass)
+    counts = await store.async_import(
+        parser.tasks, parser.history, parser.templates, parser.categories
+    )
+    await _get_coordinator(hass).async_refresh()
+    connection.send_result(msg["id"], {"applied": True, **counts})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/get_history",
+        vol.Required("task_id"): str,
+        vol.Optional("offset", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional("limit", default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+@callback
+def ws_get_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle get completion history WebSocket command."""
+    store = _get_store(hass)
+    history = store.get_history(msg["task_id"], msg["offset"], msg["limit"])
+    if history is None:
+        connection.send_error(msg["id"], "not_found", "Task not found")
+        return
+    connection.send_result(msg["id"], history)
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "wartungsplaner/get_templates",
+        vol.Optional("version"): str,
     }
 )
 @callback
@@ -222,15 +710,18 @@ def ws_get_templates(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Handle get templates WebSocket command."""
+    """Handle get templates WebSocket command.
+
+    If the client sends the version it already has and nothing changed,
+    only the version is returned.
+    """
     store = _get_store(hass)
-    builtin = [t for t in get_templates() if t["id"] not in store.hidden_templates]
-    custom = list(store.custom_templates.values())
-    hidden_count = len(store.hidden_templates)
-    connection.send_result(msg["id"], {
-        "templates": builtin + custom,
-        "hidden_count": hidden_count,
-    })
+    if msg.get("version") == store.templates_version:
+        connection.send_result(
+            msg["id"], {"version": store.templates_version, "unchanged": True}
+        )
+        return
+    connection.send_result(msg["id"], store.get_templates_payload())
 
 
 @websocket_api.websocket_command(
@@ -257,7 +748,78 @@ async def ws_add_from_template(
         connection.send_error(msg["id"], "not_found", "Template not found")
         return
 
-    task_data = {
+    task = await store.async_add_task(_template_to_task_data(template))
+    await coordinator.async_refresh()
+    connection.send_result(msg["id"], {"task": task.as_dict()})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "wartungsplaner/add_from_templates",
+        vol.Exclusive("template_ids", "source"): [str],
+        vol.Exclusive("category", "source"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_add_from_templates(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle add tasks from several templates or a whole category.
+
+    All tasks are created in one batch with a single save and refresh.
+    Without template IDs, all visible builtin and custom templates of the
+    category are used.
+    """
+    store = _get_store(hass)
+    coordinator = _get_coordinator(hass)
+
+    if "template_ids" in msg:
+        templates = []
+        missing = []
+        for template_id in msg["template_ids"]:
+            template = get_template_by_id(template_id) or store.custom_templates.get(
+                template_id
+            )
+            if template is None:
+                missing.append(template_id)
+            else:
+                templates.append(template)
+        if missing:
+            connection.send_error(
+                msg["id"], "not_found", f"Templates not found: {', '.join(missing)}"
+            )
+            return
+    elif "category" in msg:
+        category = msg["category"]
+        templates = [
+            t
+            for t in get_templates_by_category(category)
+            if t["id"] not in store.hidden_templates
+        ]
+        templates.extend(
+            t for t in store.custom_templates.values() if t["category"] == category
+        )
+    else:
+        connection.send_error(
+            msg["id"], "invalid_format", "Either template_ids or category is required"
+        )
+        return
+
+    _, results = await store.async_bulk(
+        [{"op": "add", **_template_to_task_data(t)} for t in templates]
+    )
+    if results:
+        await coordinator.async_refresh()
+    connection.send_result(
+        msg["id"], {"tasks": [result["task"] for result in results]}
+    )
+
+
+def _template_to_task_data(template: dict[str, Any]) -> dict[str, Any]:
+    """Return the task fields copied from a template."""
+    return {
         "name": template["name"],
         "description": template["description"],
         "category": template["category"],
@@ -266,10 +828,6 @@ async def ws_add_from_template(
         "interval_unit": template["interval_unit"],
     }
 
-    task = await store.async_add_task(task_data)
-    await coordinator.async_refresh()
-    connection.send_result(msg["id"], {"task": task})
-
 
 @websocket_api.websocket_command(
     {
@@ -294,7 +852,7 @@ async def ws_snooze_task(
         return
 
     await coordinator.async_refresh()
-    connection.send_result(msg["id"], {"task": task})
+    connection.send_result(msg["id"], {"task": task.as_dict()})
 
 
 # --- Categories ---
@@ -327,6 +885,9 @@ def ws_get_categories(
     custom = [
         {**c, "builtin": False} for c in store.custom_categories.values()
     ]
+    task_counts = store.category_counts
+    for category in builtin + custom:
+        category["task_count"] = task_counts.get(category["id"], 0)
     connection.send_result(msg["id"], {"categories": builtin + custom})
 
 
@@ -490,6 +1051,13 @@ def ws_get_settings(
             vol.Coerce(int), vol.Range(min=1, max=90)
         ),
         vol.Optional("conversation_agent_id"): str,
+        vol.Optional("save_delay"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=60)
+        ),
+        vol.Optional("history_retention"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
+        ),
+        vol.Optional("attribute_profile"): vol.In([p.value for p in AttributeProfile]),
     }
 )
 @websocket_api.async_response
@@ -503,8 +1071,12 @@ async def ws_update_settings(
     coordinator = _get_coordinator(hass)
 
     data = {k: v for k, v in msg.items() if k not in ("id", "type")}
+    profile = store.attribute_profile
     settings = await store.async_update_settings(data)
     await coordinator.async_refresh()
+    if store.attribute_profile != profile:
+        # Entity attributes changed without any task changing
+        coordinator.async_update_all_task_listeners()
     connection.send_result(msg["id"], {"settings": settings})
 
 
@@ -0,0 +1,9 @@
+"""Fixtures for Wartungsplaner tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow loading the integration from custom_components."""
+    yield
@@ -0,0 +1,171 @@
+"""Tests for the Wartungsplaner coordinator."""
+
+from datetime import date, datetime, timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.wartungsplaner.const import TaskStatus
+from custom_components.wartungsplaner.coordinator import WartungsplanerCoordinator
+from custom_components.wartungsplaner.store import WartungsplanerStore
+
+NOW = datetime(2026, 3, 15, 12, 0)
+
+
+def _days_ago(days: int) -> str:
+    """Return the ISO date a number of days before NOW."""
+    return (NOW.date() - timedelta(days=days)).isoformat()
+
+
+def _assert_matches_full_pass(
+    coordinator: WartungsplanerCoordinator, store: WartungsplanerStore
+) -> None:
+    """Assert the coordinator data equals a computation from scratch."""
+    expected = WartungsplanerCoordinator(coordinator.hass, store)._compute_data(
+        dt_util.now().date()
+    )
+    data = coordinator.data
+    assert data["tasks"] == expected["tasks"]
+    assert data["stats"] == expected["stats"]
+    # Categories without tasks keep zero counters instead of disappearing
+    assert {
+        category: counts
+        for category, counts in data["category_stats"].items()
+        if counts["total"]
+    } == expected["category_stats"]
+    for status in TaskStatus:
+        assert coordinator.get_task_ids_by_status(status) == {
+            task_id
+            for task_id, state in expected["tasks"].items()
+            if state.status == status
+        }
+    today = dt_util.now().date()
+    assert [state.task.id for state in coordinator.get_overdue_tasks(today)] == [
+        state.task.id
+        for state in sorted(
+            (
+                state
+                for state in expected["tasks"].values()
+                if state.status == "overdue"
+            ),
+            key=lambda state: (state.task.next_due, state.task.id),
+        )
+    ]
+
+
+async def test_incremental_updates_match_full_pass(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Recomputing changed tasks only gives the data of a full pass."""
+    freezer.move_to(dt_util.as_utc(NOW.replace(tzinfo=dt_util.get_default_time_zone())))
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    due = await store.async_add_task(
+        {
+            "name": "Heizung",
+            "category": "heating",
+            "interval_value": 10,
+            "interval_unit": "days",
+            "last_completed": _days_ago(10),
+        }
+    )
+    due_soon = await store.async_add_task(
+        {
+            "name": "Filter",
+            "category": "heating",
+            "interval_value": 10,
+            "interval_unit": "days",
+            "last_completed": _days_ago(9),
+        }
+    )
+    never_done = await store.async_add_task(
+        {"name": "Rauchmelder", "category": "safety"}
+    )
+    overdue = await store.async_add_task(
+        {
+            "name": "Dachrinne",
+            "category": "exterior",
+            "interval_value": 10,
+            "interval_unit": "days",
+            "last_completed": _days_ago(30),
+        }
+    )
+    coordinator = WartungsplanerCoordinator(hass, store)
+    await coordinator.async_refresh()
+    _assert_matches_full_pass(coordinator, store)
+    assert coordinator.data["stats"] == {
+        "total": 4,
+        "overdue": 1,
+        "due_soon": 1,
+        "due": 1,
+        "done": 0,
+        "never_done": 1,
+        "snoozed": 0,
+    }
+
+    added = await store.async_add_task(
+        {"name": "Rasen", "category": "garden", "last_completed": _days_ago(1)}
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_changes.added == {added.id}
+    assert not coordinator.last_changes.changed
+    _assert_matches_full_pass(coordinator, store)
+
+    steps = (
+        lambda: store.async_complete_task(overdue.id),
+        lambda: store.async_snooze_task(due_soon.id, _days_ago(-5)),
+        lambda: store.async_update_task(due.id, {"category": "garden"}),
+        lambda: store.async_delete_task(never_done.id),
+    )
+    for step in steps:
+        await step()
+        await coordinator.async_refresh()
+        assert (
+            len(coordinator.last_changes.changed | coordinator.last_changes.removed)
+            == 1
+        )
+        _assert_matches_full_pass(coordinator, store)
+
+    assert coordinator.last_changes.removed == {never_done.id}
+    assert coordinator.data["category_stats"]["safety"]["total"] == 0
+    await coordinator.async_shutdown()
+
+
+async def test_day_rollover_recomputes_all_tasks(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """A new day re-evaluates every task, not only the changed ones."""
+    freezer.move_to(dt_util.as_utc(NOW.replace(tzinfo=dt_util.get_default_time_zone())))
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    due_tomorrow = await store.async_add_task(
+        {
+            "name": "Filter",
+            "interval_value": 10,
+            "interval_unit": "days",
+            "last_completed": _days_ago(9),
+        }
+    )
+    later = await store.async_add_task(
+        {
+            "name": "Heizung",
+            "interval_value": 30,
+            "interval_unit": "days",
+            "last_completed": _days_ago(1),
+        }
+    )
+    coordinator = WartungsplanerCoordinator(hass, store)
+    await coordinator.async_refresh()
+    assert coordinator.data["tasks"][due_tomorrow.id].status == TaskStatus.DUE_SOON
+
+    freezer.tick(timedelta(days=1))
+    assert dt_util.now().date() == date(2026, 3, 16)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_changes.changed == {due_tomorrow.id, later.id}
+    assert coordinator.data["tasks"][due_tomorrow.id].status == TaskStatus.DUE
+    assert coordinator.data["tasks"][later.id].days_until_due == 28
+    _assert_matches_full_pass(coordinator, store)
+    await coordinator.async_shutdown()
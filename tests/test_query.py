@@ -0,0 +1,104 @@
+"""Tests for filtering, sorting and paging of tasks."""
+
+import base64
+import json
+import random
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from custom_components.wartungsplaner.const import TaskPriority, TaskStatus
+from custom_components.wartungsplaner.models import Task, TaskState
+from custom_components.wartungsplaner.query import (
+    SORT_KEYS,
+    InvalidCursor,
+    page_tasks,
+)
+
+TODAY = date(2026, 3, 15)
+
+
+def _states(count: int, seed: int = 21) -> list[TaskState]:
+    """Return task states with many equal sort values."""
+    rng = random.Random(seed)
+    states = []
+    for index in range(count):
+        days = rng.choice((None, -3, 0, 0, 5, 30))
+        next_due = TODAY + timedelta(days=days) if days is not None else None
+        task = Task.from_dict(
+            {
+                "id": f"task_{index:03}",
+                "name": rng.choice(("Filter", "filter", "Heizung")),
+                "priority": rng.choice(list(TaskPriority)),
+                "next_due": next_due.isoformat() if next_due else None,
+                "created_at": f"2026-01-{rng.randint(1, 3):02}",
+            }
+        )
+        status = rng.choice(list(TaskStatus))
+        states.append(TaskState(task, status, days))
+    return states
+
+
+def _all_pages(
+    states: list[TaskState], sort: str, descending: bool, limit: int
+) -> list[list[str]]:
+    """Return the task IDs of all pages, following the cursors."""
+    pages = []
+    cursor = None
+    while True:
+        page, cursor = page_tasks(states, sort, descending, cursor, limit)
+        pages.append([state.task.id for state in page])
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort", list(SORT_KEYS))
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_cover_sorted_tasks(sort: str, descending: bool) -> None:
+    """Following the cursors returns every task once, in sort order."""
+    states = _states(50)
+    pages = _all_pages(states, sort, descending, limit=7)
+
+    assert [len(page) for page in pages] == [7] * 7 + [1]
+    expected, _ = page_tasks(states, sort, descending)
+    assert [task_id for page in pages for task_id in page] == [
+        state.task.id for state in expected
+    ]
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_are_stable_while_tasks_change(descending: bool) -> None:
+    """Tasks added or removed before the cursor do not shift later pages."""
+    states = _states(30)
+    first, cursor = page_tasks(states, "next_due", descending, None, 10)
+    expected, _ = page_tasks(states, "next_due", descending, cursor, 10)
+
+    # Remove two tasks of the first page and add one sorting next to another
+    neighbour = first[1]
+    added = TaskState(
+        replace(neighbour.task, id=f"{neighbour.task.id}a"),
+        neighbour.status,
+        neighbour.days_until_due,
+    )
+    removed = (first[0], first[2])
+    changed = [state for state in states if state not in removed] + [added]
+    second, _ = page_tasks(changed, "next_due", descending, cursor, 10)
+
+    assert [state.task.id for state in second] == [state.task.id for state in expected]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"{").decode(),
+        base64.urlsafe_b64encode(json.dumps({"key": 1}).encode()).decode(),
+        # The shape of a cursor of another sort order
+        base64.urlsafe_b64encode(json.dumps(["Filter", "task_001"]).encode()).decode(),
+    ],
+)
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    """Cursors that do not decode to a status sort key are rejected."""
+    with pytest.raises(InvalidCursor):
+        page_tasks(_states(5), "status", cursor=cursor, limit=2)
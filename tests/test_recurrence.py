@@ -0,0 +1,54 @@
+"""Tests for the Wartungsplaner interval arithmetic."""
+
+from datetime import date
+
+from custom_components.wartungsplaner.recurrence import (
+    expand_occurrences,
+    task_occurrences,
+)
+
+
+def test_month_ends_do_not_drift() -> None:
+    """Occurrences are computed from the first date."""
+    assert expand_occurrences(
+        date(2026, 1, 31), 1, "months", date(2026, 1, 1), date(2026, 5, 1)
+    ) == (date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30))
+
+
+def test_task_due_in_future() -> None:
+    """A task not yet due recurs from its next due date."""
+    assert task_occurrences(
+        date(2026, 6, 10),
+        1,
+        "months",
+        date(2026, 6, 1),
+        date(2026, 6, 1),
+        date(2026, 9, 1),
+    ) == (date(2026, 6, 10), date(2026, 7, 10), date(2026, 8, 10))
+
+
+def test_overdue_task() -> None:
+    """An overdue task shows once, later occurrences start after today."""
+    occurrences = task_occurrences(
+        date(2026, 2, 15),
+        1,
+        "months",
+        date(2026, 6, 1),
+        date(2026, 1, 1),
+        date(2026, 9, 1),
+    )
+
+    # Nothing is invented between the old due date and today
+    assert occurrences == (date(2026, 2, 15), date(2026, 7, 1), date(2026, 8, 1))
+
+
+def test_overdue_task_outside_range() -> None:
+    """The overdue event is only returned if it lies in the range."""
+    assert task_occurrences(
+        date(2026, 2, 15),
+        2,
+        "weeks",
+        date(2026, 6, 1),
+        date(2026, 6, 1),
+        date(2026, 7, 1),
+    ) == (date(2026, 6, 15), date(2026, 6, 29))
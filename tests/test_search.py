@@ -0,0 +1,63 @@
+"""Tests for the Wartungsplaner search index."""
+
+from custom_components.wartungsplaner.models import Task
+from custom_components.wartungsplaner.search import SearchIndex
+
+
+def _index(*names: str) -> SearchIndex:
+    """Return an index of tasks named after their position."""
+    index = SearchIndex()
+    for task_id, name in enumerate(names):
+        index.update(Task.from_dict({"id": str(task_id), "name": name}))
+    return index
+
+
+def _names(index: SearchIndex, names: tuple[str, ...], query: str) -> list[str]:
+    """Return the names of the tasks matching a query, best first."""
+    return [names[int(task_id)] for task_id, _ in index.search(query)]
+
+
+def test_compound_words() -> None:
+    """Words are found inside German compound nouns."""
+    names = (
+        "Lüftungsfilter wechseln",
+        "Poolfilter reinigen",
+        "Rauchmelder testen",
+        "Filter prüfen",
+    )
+    index = _index(*names)
+
+    # The exact match ranks first
+    assert _names(index, names, "filter") == [
+        "Filter prüfen",
+        "Lüftungsfilter wechseln",
+        "Poolfilter reinigen",
+    ]
+    assert _names(index, names, "melder") == ["Rauchmelder testen"]
+    assert _names(index, names, "pool filter") == ["Poolfilter reinigen"]
+    assert _names(index, names, "lüftungs") == ["Lüftungsfilter wechseln"]
+
+
+def test_short_words() -> None:
+    """Words shorter than an n-gram match at the start and inside tokens."""
+    names = ("Rauchmelder testen", "Heizöl bestellen", "Ölwechsel Brenner")
+    index = _index(*names)
+
+    assert _names(index, names, "ra") == ["Rauchmelder testen"]
+    # The prefix match ranks above the match inside "heizol"
+    assert _names(index, names, "öl") == ["Ölwechsel Brenner", "Heizöl bestellen"]
+    assert _names(index, names, "b") == ["Heizöl bestellen", "Ölwechsel Brenner"]
+    assert _names(index, names, "x") == []
+
+
+def test_umlauts_and_removal() -> None:
+    """Umlauts match both foldings, removed tasks are no longer found."""
+    names = ("Ölwechsel Brenner", "Heizöl bestellen")
+    index = _index(*names)
+
+    assert _names(index, names, "oel") == ["Ölwechsel Brenner", "Heizöl bestellen"]
+    assert _names(index, names, "heizol") == ["Heizöl bestellen"]
+
+    index.discard("1")
+    assert _names(index, names, "öl") == ["Ölwechsel Brenner"]
+    assert _names(index, names, "heiz") == []
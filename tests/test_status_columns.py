@@ -0,0 +1,90 @@
+"""Tests for the columnar status computation."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wartungsplaner import status_columns
+from custom_components.wartungsplaner.coordinator import WartungsplanerCoordinator
+from custom_components.wartungsplaner.status_columns import StatusColumns
+from custom_components.wartungsplaner.store import WartungsplanerStore
+
+TODAY = date(2026, 3, 15)
+DUE_SOON_DAYS = 7
+
+
+def _random_date(rng: random.Random) -> date | None:
+    """Return None or a date around TODAY, often on a status boundary."""
+    if rng.random() < 0.15:
+        return None
+    offset = rng.choice((-1, 0, 1, DUE_SOON_DAYS, DUE_SOON_DAYS + 1))
+    if rng.random() < 0.5:
+        offset = rng.randint(-400, 400)
+    return TODAY + timedelta(days=offset)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with each backend of StatusColumns."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(status_columns, "np", None)
+    return request.param
+
+
+async def test_columns_match_scalar_status(hass: HomeAssistant, backend: str) -> None:
+    """Both backends give the statuses and days of the scalar computation."""
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    coordinator = WartungsplanerCoordinator(hass, store)
+    assert coordinator.due_soon_days == DUE_SOON_DAYS
+
+    rng = random.Random(13)
+    columns = StatusColumns()
+    assert columns.backend == backend
+    dates: dict[str, tuple[date | None, date | None]] = {}
+    for index in range(500):
+        task_id = f"task_{index}"
+        dates[task_id] = (_random_date(rng), _random_date(rng))
+        columns.set(task_id, *dates[task_id])
+    # Updates keep the position of a task
+    for task_id in rng.sample(sorted(dates), 50):
+        dates[task_id] = (_random_date(rng), _random_date(rng))
+        columns.set(task_id, *dates[task_id])
+
+    for step in range(3):
+        if step:
+            # Removing moves the last row into the gap
+            for task_id in rng.sample(sorted(dates), 100):
+                columns.discard(task_id)
+                del dates[task_id]
+            columns.discard("unknown")
+
+        statuses, days, counts = columns.compute(TODAY, DUE_SOON_DAYS)
+
+        assert sorted(columns.task_ids) == sorted(dates)
+        assert len(columns) == len(dates)
+        expected_counts = dict.fromkeys(counts, 0)
+        for task_id, status, days_until_due in zip(
+            columns.task_ids, statuses, days, strict=True
+        ):
+            next_due, snoozed_until = dates[task_id]
+            expected = coordinator._compute_task_status(next_due, snoozed_until, TODAY)
+            assert status == expected
+            assert days_until_due == coordinator._compute_days_until_due(
+                next_due, TODAY
+            )
+            expected_counts[expected] += 1
+        assert counts == expected_counts
+
+
+def test_empty_columns(backend: str) -> None:
+    """An empty column set has no statuses and zero counts."""
+    statuses, days, counts = StatusColumns().compute(TODAY, DUE_SOON_DAYS)
+    assert statuses == []
+    assert days == []
+    assert set(counts.values()) == {0}
@@ -0,0 +1,235 @@
+"""Tests for the Wartungsplaner store."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.wartungsplaner.const import (
+    HISTORY_STORAGE_KEY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from custom_components.wartungsplaner.store import WartungsplanerStore
+
+LEGACY_HISTORY = [
+    {"date": "2025-03-01", "notes": "", "timestamp": "2025-03-01T10:00:00"},
+    {"date": "2026-03-01", "notes": "Filter neu", "timestamp": "2026-03-01T10:00:00"},
+]
+
+
+def _legacy_data() -> dict[str, Any]:
+    """Return a main file of a version before sharding and separate history."""
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "tasks": {
+                "heizung": {
+                    "id": "heizung",
+                    "name": "Heizung warten",
+                    "category": "heating",
+                    "interval_value": 1,
+                    "interval_unit": "years",
+                    "last_completed": "2026-03-01",
+                    "completion_count": 2,
+                    "completion_history": LEGACY_HISTORY,
+                }
+            },
+            "settings": {"due_soon_days": 7},
+        },
+    }
+
+
+async def test_migration_writes_main_file_last(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """An interrupted migration keeps the history and is repeated."""
+    hass_storage[STORAGE_KEY] = _legacy_data()
+    original_save = Store.async_save
+
+    async def failing_save(store: Store, data: Any) -> None:
+        if store.key == STORAGE_KEY:
+            raise OSError("disk full")
+        await original_save(store, data)
+
+    with (
+        patch.object(Store, "async_save", failing_save),
+        pytest.raises(OSError),
+    ):
+        await WartungsplanerStore(hass).async_load()
+
+    # History and shard were written, the main file still holds the tasks
+    assert hass_storage[HISTORY_STORAGE_KEY]["data"]["tasks"]["heizung"][
+        "entries"
+    ] == LEGACY_HISTORY
+    assert "heizung" in hass_storage[f"{STORAGE_KEY}.heating"]["data"]["tasks"]
+    assert "heizung" in hass_storage[STORAGE_KEY]["data"]["tasks"]
+
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+
+    assert "tasks" not in hass_storage[STORAGE_KEY]["data"]
+    assert hass_storage[STORAGE_KEY]["data"]["shards"] == ["heating"]
+    assert store.tasks["heizung"].name == "Heizung warten"
+    assert store.tasks["heizung"].completion_count == 2
+    assert store.get_full_history("heizung") == {
+        "entries": LEGACY_HISTORY,
+        "summaries": {},
+    }
+
+
+async def test_repeated_migration_keeps_history_once(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Inline history already moved to the history file is not added again."""
+    hass_storage[STORAGE_KEY] = _legacy_data()
+    hass_storage[HISTORY_STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": HISTORY_STORAGE_KEY,
+        "data": {
+            "tasks": {
+                "heizung": {"entries": LEGACY_HISTORY[:1], "summaries": {}}
+            }
+        },
+    }
+
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+
+    assert store.tasks["heizung"].completion_count == 2
+    assert store.get_full_history("heizung")["entries"] == LEGACY_HISTORY
+
+
+async def test_invalid_update_changes_nothing(hass: HomeAssistant) -> None:
+    """An update with an invalid date is rejected as a whole."""
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    task = await store.async_add_task({"name": "Filter wechseln"})
+
+    with pytest.raises(ValueError):
+        await store.async_update_task(
+            task.id,
+            {
+                "name": "Pumpe prüfen",
+                "category": "pool",
+                "last_completed": "2026-13-01",
+            },
+        )
+
+    assert store.tasks[task.id] is task
+    assert task.name == "Filter wechseln"
+    assert [task_id for task_id, _ in store.search("filter")] == [task.id]
+    assert not store.search("pumpe")
+
+
+async def test_save_stats_count_delayed_writes(hass: HomeAssistant) -> None:
+    """A burst of changes is one write per file, and flushing skips it later."""
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+
+    for index in range(5):
+        await store.async_add_task({"name": f"Filter {index}", "category": "heating"})
+    await hass.async_block_till_done()
+    # The main file lists the new shard, the shard holds all five tasks
+    assert store.save_stats["scheduled"] == 6
+    assert store.save_stats["written"] == 0
+    assert store.save_stats["coalesced"] == 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+
+    assert store.save_stats["written"] == 2
+    assert store.save_stats["coalesced"] == 4
+
+    with patch.object(Store, "async_save") as save:
+        await store.async_flush()
+    save.assert_not_called()
+
+
+async def test_unlisted_shard_is_loaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A shard written before the main file listed it is not lost."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {"shards": [], "settings": {"due_soon_days": 7}},
+    }
+    hass_storage[f"{STORAGE_KEY}.garden"] = {
+        "version": STORAGE_VERSION,
+        "key": f"{STORAGE_KEY}.garden",
+        "data": {
+            "tasks": {
+                "hecke": {"id": "hecke", "name": "Hecke schneiden", "category": "garden"}
+            }
+        },
+    }
+
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    assert store.tasks["hecke"].name == "Hecke schneiden"
+    assert store.shard_count == 1
+
+    await store.async_flush()
+    assert hass_storage[STORAGE_KEY]["data"]["shards"] == ["garden"]
+
+
+async def test_bulk_is_all_or_nothing(hass: HomeAssistant) -> None:
+    """A batch with one invalid operation changes nothing."""
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    first = await store.async_add_task({"name": "Filter wechseln"})
+    second = await store.async_add_task({"name": "Heizung warten"})
+    store.async_pop_changed_task_ids()
+    tasks_before = dict(store.tasks)
+
+    applied, results = await store.async_bulk(
+        [
+            {"op": "add", "name": "Rasen mähen"},
+            {"op": "update", "task_id": first.id, "name": "Pumpe prüfen"},
+            {"op": "complete", "task_id": second.id},
+            {"op": "snooze", "task_id": first.id, "until_date": "2026-02-30"},
+            {"op": "delete", "task_id": second.id},
+            {"op": "complete", "task_id": second.id},
+            {"op": "delete", "task_id": "unknown"},
+        ]
+    )
+
+    assert not applied
+    assert [result.get("error") for result in results] == [
+        None,
+        None,
+        None,
+        "invalid_date",
+        None,
+        "not_found",
+        "not_found",
+    ]
+    assert store.tasks == tasks_before
+    assert not store.has_changed_tasks
+    assert not store.search("pumpe")
+
+    applied, results = await store.async_bulk(
+        [
+            {"op": "add", "name": "Rasen mähen"},
+            {"op": "update", "task_id": first.id, "name": "Pumpe prüfen"},
+            {"op": "snooze", "task_id": first.id, "until_date": "2026-12-01"},
+            {"op": "delete", "task_id": second.id},
+        ]
+    )
+
+    assert applied
+    assert all(result["success"] for result in results)
+    added_id = results[0]["task_id"]
+    assert set(store.tasks) == {first.id, added_id}
+    assert store.tasks[first.id].name == "Pumpe prüfen"
+    assert results[2]["task"]["snoozed_until"] == "2026-12-01"
+    assert results[3]["task"] is None
@@ -0,0 +1,158 @@
+"""Tests for export and import of tasks."""
+
+import random
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wartungsplaner.store import WartungsplanerStore
+from custom_components.wartungsplaner.transfer import (
+    CSV_COLUMNS,
+    ImportParser,
+    iter_export,
+)
+
+# Texts with the characters that need quoting or escaping
+DESCRIPTIONS = (
+    "Filter prüfen, Dichtung tauschen",
+    'Laut Handbuch "alle 2 Jahre"',
+    "Zeile eins\nZeile zwei\n",
+    "",
+)
+
+# Not exported, as they are recalculated on import
+COMPUTED_FIELDS = ("next_due", "status", "days_until_due")
+
+
+def _without_none(record: dict, skip: tuple[str, ...] = ()) -> dict:
+    """Return the fields of a record that have a value."""
+    return {
+        key: value
+        for key, value in record.items()
+        if value is not None and key not in skip
+    }
+
+
+async def _store(hass: HomeAssistant) -> WartungsplanerStore:
+    """Return a store with categories, templates, tasks and history."""
+    store = WartungsplanerStore(hass)
+    await store.async_load()
+    await store.async_add_category({"name_de": "Pool", "name_en": "Pool"})
+    await store.async_add_custom_template({"name": "Sand wechseln", "category": "pool"})
+    for index, description in enumerate(DESCRIPTIONS):
+        task = await store.async_add_task(
+            {
+                "name": f"Aufgabe {index}",
+                "description": description,
+                "manufacturer": "Grünbeck",
+                "category": "pool",
+                "last_completed": "2026-01-15",
+            }
+        )
+        if index % 2:
+            await store.async_complete_task(task.id, 'erledigt, mit "Notiz"')
+    return store
+
+
+def _feed_in_pieces(parser: ImportParser, text: str, seed: int) -> None:
+    """Feed text in small random chunks that end anywhere."""
+    rng = random.Random(seed)
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, 9)
+        parser.feed(text[pos : pos + size])
+        pos += size
+    parser.close()
+
+
+@pytest.mark.parametrize("seed", range(5))
+async def test_ndjson_round_trip(hass: HomeAssistant, seed: int) -> None:
+    """An NDJSON export split anywhere imports to the same data."""
+    store = await _store(hass)
+    parser = ImportParser("ndjson")
+    _feed_in_pieces(parser, "".join(iter_export(store, "ndjson")), seed)
+
+    assert parser.errors == []
+    assert parser.categories == store.custom_categories
+    assert parser.templates == store.custom_templates
+    assert {task_id: _without_none(task) for task_id, task in parser.tasks.items()} == {
+        task_id: _without_none(task.as_dict(), COMPUTED_FIELDS)
+        for task_id, task in store.tasks.items()
+    }
+    assert parser.history == {
+        task_id: store.get_full_history(task_id)
+        for task_id in store.tasks
+        if store.get_full_history(task_id) is not None
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+async def test_csv_round_trip(hass: HomeAssistant, seed: int) -> None:
+    """A CSV export split inside lines and quoted fields imports the tasks."""
+    store = await _store(hass)
+    text = "".join(iter_export(store, "csv"))
+    assert text.count("\n") > len(store.tasks) + 1
+    parser = ImportParser("csv")
+    _feed_in_pieces(parser, text, seed)
+
+    assert parser.errors == []
+    assert parser.records == len(store.tasks)
+    for task_id, task in store.tasks.items():
+        imported = parser.tasks[task_id]
+        assert imported["description"] == task.description
+        assert imported["name"] == task.name
+        assert imported["last_completed"] == task.last_completed.isoformat()
+        assert imported["completion_count"] == task.completion_count
+        assert set(imported) <= set(CSV_COLUMNS)
+
+
+def test_ndjson_errors_have_line_numbers() -> None:
+    """Invalid records are reported with their line and skipped."""
+    parser = ImportParser("ndjson")
+    _feed_in_pieces(
+        parser,
+        '{"type":"meta","version":1}\n'
+        '{"type":"task","id":"a","name":"Filter"}\n'
+        "{not json\n"
+        "\n"
+        '{"type":"task","id":"b","name":""}\n'
+        '{"type":"gadget"}\n'
+        '{"type":"task","id":"c","name":"Pumpe","last_completed":"2026-13-01"}\n'
+        '{"type":"history","task_id":"x","entries":[]}\n'
+        '["type","task"]',
+        seed=0,
+    )
+
+    assert list(parser.tasks) == ["a"]
+    assert [error["line"] for error in parser.errors] == [3, 5, 6, 7, 9, 0]
+    assert parser.errors[0]["error"] == "invalid JSON"
+    assert parser.errors[2]["error"] == "unknown record type gadget"
+    assert parser.errors[-1]["error"] == "history of unknown task x"
+
+
+def test_newer_export_version_is_rejected() -> None:
+    """Exports of a newer format version are reported as unsupported."""
+    parser = ImportParser("ndjson")
+    _feed_in_pieces(parser, '{"type":"meta","version":99}\n', seed=0)
+    assert parser.errors == [{"line": 1, "error": "unsupported export version"}]
+
+
+def test_csv_errors_have_line_numbers() -> None:
+    """CSV errors point to the first line of the record."""
+    parser = ImportParser("csv")
+    _feed_in_pieces(
+        parser,
+        "id,name,description\n"
+        'a,Filter,"zwei\nZeilen"\n'
+        "b,Pumpe\n"
+        'c,Heizung,"offen\nbis zum Ende\n',
+        seed=0,
+    )
+
+    assert list(parser.tasks) == ["a"]
+    assert parser.tasks["a"]["description"] == "zwei\nZeilen"
+    assert parser.errors == [
+        {"line": 4, "error": "wrong number of columns"},
+        {"line": 5, "error": "unterminated quoted field"},
+    ]